@@ -8,7 +8,7 @@ from typing import Any, Dict, List
 
 from smolagents import CodeAgent
 
-from tracebrain.core.schema import TraceBrainAttributes, SpanType, get_iso_time_now
+from tracebrain.core.schema import TraceBrainAttributes, SpanType, get_iso_time_now_cached
 
 
 def convert_smolagent_to_otlp(agent: CodeAgent, query: str) -> Dict:
@@ -89,7 +89,7 @@ def convert_smolagent_to_otlp(agent: CodeAgent, query: str) -> Dict:
 
     def _to_iso(timestamp: float | datetime | None) -> str:
         if timestamp is None:
-            timestamp = datetime.now(timezone.utc)
+            return get_iso_time_now_cached()
         if isinstance(timestamp, datetime):
             return timestamp.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
         return datetime.fromtimestamp(float(timestamp), tz=timezone.utc).isoformat().replace("+00:00", "Z")
@@ -39,20 +39,19 @@ def main() -> None:
     )
     agent = create_agent(model=model, tools=[check_inventory], system_prompt=system_prompt)
 
-    client = TraceClient(base_url="http://localhost:8000")
+    with TraceClient(base_url="http://localhost:8000") as client:
+        if not client.health_check():
+            print("\nTraceBrain server is not running. Please start it first.")
+            return
 
-    if not client.health_check():
-        print("\nTraceBrain server is not running. Please start it first.")
-        return
+        user_message = "Check inventory for 'Laptop'"
 
-    user_message = "Check inventory for 'Laptop'"
+        with client.trace_scope(system_prompt=system_prompt) as tracker:
+            result = agent.invoke({"messages": [{"role": "user", "content": user_message}]})
 
-    with client.trace_scope(system_prompt=system_prompt) as tracker:
-        result = agent.invoke({"messages": [{"role": "user", "content": user_message}]})
-
-        messages = result.get("messages", [])
-        otlp_trace = convert_langchain_to_otlp(messages, system_prompt=system_prompt)
-        tracker["spans"] = otlp_trace.get("spans", [])
+            messages = result.get("messages", [])
+            otlp_trace = convert_langchain_to_otlp(messages, system_prompt=system_prompt)
+            tracker["spans"] = otlp_trace.get("spans", [])
 
     print("\nDone. Check the Trace Explorer UI.")
 
@@ -34,23 +34,22 @@ print("✅ Agent is ready.")
 # PART 2: RUN AND LOG TRACE TO TRACEBRAIN
 
 if __name__ == "__main__":
-    # 1. Initialize TraceClient
-    client = TraceClient(base_url="http://localhost:8000")
-    
-    # 2. Check if the server is running
-    if not client.health_check():
-        print("\n❌ TraceBrain server is not running. Please run 'tracebrain up' first.")
-    else:
-        # 3. Run the agent inside trace_scope so tool calls attach to a trace_id.
-        # This is required for Active Help Request and recommended for all runs.
-        query = "What is the stock price of NVDA?"
-        print(f"\n--- Running agent for query: '{query}' ---")
-        with client.trace_scope(system_prompt=my_agent.instructions) as trace:
-            my_agent.run(query)
-
-            # 4. Convert results from agent's memory to OTLP and attach spans
-            otlp_trace_data = convert_smolagent_to_otlp(my_agent, query)
-            trace["spans"] = otlp_trace_data.get("spans", [])
-
-        # 5. Check results on UI
-        print("\n🎉 Process complete! Check the Trace Explorer UI.")
\ No newline at end of file
+    # 1. Initialize TraceClient (the context manager closes its HTTP session)
+    with TraceClient(base_url="http://localhost:8000") as client:
+        # 2. Check if the server is running
+        if not client.health_check():
+            print("\n❌ TraceBrain server is not running. Please run 'tracebrain up' first.")
+        else:
+            # 3. Run the agent inside trace_scope so tool calls attach to a trace_id.
+            # This is required for Active Help Request and recommended for all runs.
+            query = "What is the stock price of NVDA?"
+            print(f"\n--- Running agent for query: '{query}' ---")
+            with client.trace_scope(system_prompt=my_agent.instructions) as trace:
+                my_agent.run(query)
+
+                # 4. Convert results from agent's memory to OTLP and attach spans
+                otlp_trace_data = convert_smolagent_to_otlp(my_agent, query)
+                trace["spans"] = otlp_trace_data.get("spans", [])
+
+            # 5. Check results on UI
+            print("\n🎉 Process complete! Check the Trace Explorer UI.")
\ No newline at end of file
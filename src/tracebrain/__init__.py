@@ -48,6 +48,7 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "TraceBrain Team"
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -65,18 +66,20 @@ __all__ = [
 ]
 
 
+_LAZY_ATTRS = {
+    "app": ".main",
+    "settings": ".config",
+    "TraceClient": ".sdk",
+    "TraceScope": ".sdk.client",
+}
+
+
 def __getattr__(name: str):
     # Lazily import heavy modules to keep CLI startup lightweight.
-    if name == "app":
-        from .main import app as value
-        return value
-    if name == "settings":
-        from .config import settings as value
-        return value
-    if name == "TraceClient":
-        from .sdk import TraceClient as value
-        return value
-    if name == "TraceScope":
-        from .sdk.client import TraceScope as value
-        return value
-    raise AttributeError(f"module 'tracebrain' has no attribute '{name}'")
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'tracebrain' has no attribute '{name}'")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
@@ -93,39 +93,12 @@ def list_episode_summaries(
 def get_episode_details(episode_id: str):
     """Get episode details including the list of traces in that episode."""
     try:
-        traces_in_episode = store.get_traces_by_episode_id(episode_id)
+        summaries = store.get_episode_trace_summaries(episode_id)
 
-        if not traces_in_episode:
+        if not summaries:
             raise HTTPException(status_code=404, detail="Episode not found")
 
-        trace_summaries: List[TraceSummaryOut] = []
-        for trace in traces_in_episode:
-            spans = trace.spans or []
-            span_count = len(spans)
-
-            start_times = [span.start_time for span in spans if span.start_time]
-            end_times = [span.end_time for span in spans if span.end_time]
-            duration_ms = 0.0
-            if start_times and end_times:
-                duration_ms = (max(end_times) - min(start_times)).total_seconds() * 1000
-
-            status = "OK"
-            for span in spans:
-                name = (span.name or "").lower()
-                span_type = (span.attributes or {}).get("tracebrain.span.type")
-                if "error" in name or span_type == "tool_error":
-                    status = "ERROR"
-                    break
-
-            trace_summaries.append(
-                TraceSummaryOut(
-                    trace_id=trace.id,
-                    status=status,
-                    duration_ms=round(duration_ms, 2),
-                    span_count=span_count,
-                    created_at=trace.created_at,
-                )
-            )
+        trace_summaries: List[TraceSummaryOut] = [TraceSummaryOut(**summary) for summary in summaries]
 
         return EpisodeOut(episode_id=episode_id, traces=trace_summaries)
 
@@ -31,6 +31,8 @@ from .api_models import (
     SpanIn,
     TraceIn,
     TraceIngestResponse,
+    TraceBatchIn,
+    TraceBatchIngestResponse,
     TraceInitIn,
     HistoryListOut,
     HistoryAddRequest,
@@ -69,6 +71,8 @@ __all__ = [
     "SpanIn",
     "TraceIn",
     "TraceIngestResponse",
+    "TraceBatchIn",
+    "TraceBatchIngestResponse",
     "TraceInitIn",
     "HistoryListOut",
     "HistoryAddRequest",
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
+from ....core.schema import MAX_TRACE_BATCH_SIZE
+
 
 class FeedbackOut(BaseModel):
     """Response model for feedback data."""
@@ -350,6 +352,21 @@ class TraceIngestResponse(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+class TraceBatchIn(BaseModel):
+    traces: List[TraceIn] = Field(
+        ..., max_length=MAX_TRACE_BATCH_SIZE, description="Traces to ingest in one request"
+    )
+
+
+class TraceBatchIngestResponse(BaseModel):
+    success: bool = Field(..., description="Whether the operation succeeded")
+    trace_ids: List[str] = Field(..., description="The trace IDs that were stored")
+    failed_trace_ids: List[str] = Field(
+        default_factory=list, description="Trace IDs that could not be stored (see server logs)"
+    )
+    message: str = Field(..., description="Status message")
+
+
 class TraceInitIn(BaseModel):
     trace_id: str = Field(..., description="Unique trace identifier")
     episode_id: Optional[str] = Field(None, description="Episode identifier")
@@ -36,6 +36,7 @@ def root():
             "list_traces": "GET /api/v1/traces",
             "get_trace": "GET /api/v1/traces/{trace_id}",
             "ingest_trace": "POST /api/v1/traces",
+            "ingest_traces_batch": "POST /api/v1/traces/batch",
             "batch_evaluate": "POST /api/v1/ops/batch_evaluate",
             "cleanup_traces": "DELETE /api/v1/ops/traces/cleanup",
             "init_trace": "POST /api/v1/traces/init",
@@ -19,6 +19,8 @@ from .schemas.api_models import (
     ExperienceSearchResponse,
     FeedbackIn,
     FeedbackResponse,
+    TraceBatchIn,
+    TraceBatchIngestResponse,
     TraceIn,
     TraceIngestResponse,
     TraceInitIn,
@@ -300,6 +302,45 @@ async def ingest_trace(trace: TraceIn, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=f"Failed to store trace: {str(exc)}")
 
 
+@router.post(
+    "/traces/batch",
+    response_model=TraceBatchIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Traces"],
+)
+async def ingest_traces_batch(batch: TraceBatchIn, background_tasks: BackgroundTasks):
+    """Ingest several traces in one request using the bulk insert path."""
+    try:
+        trace_payloads = [trace.model_dump() for trace in batch.traces]
+        trace_ids = await run_in_threadpool(store.add_traces_bulk, trace_payloads)
+        stored_ids = set(trace_ids)
+        failed_ids: List[str] = []
+        for trace_payload in trace_payloads:
+            trace_id = trace_payload["trace_id"]
+            if trace_id not in stored_ids:
+                failed_ids.append(trace_id)
+                continue
+            attributes = trace_payload.get("attributes") or {}
+            text_to_embed = store._extract_embedding_text(
+                attributes.get("system_prompt"),
+                trace_payload.get("spans") or [],
+            )
+            if text_to_embed:
+                background_tasks.add_task(store.update_trace_embedding, trace_id, text_to_embed)
+            if settings.AUTO_EVALUATE_TRACES and not attributes.get("tracebrain.ai_evaluation"):
+                background_tasks.add_task(run_bg_evaluation, trace_id)
+        return TraceBatchIngestResponse(
+            success=len(trace_ids) == len(trace_payloads),
+            trace_ids=trace_ids,
+            failed_trace_ids=failed_ids,
+            message=f"Stored {len(trace_ids)} of {len(trace_payloads)} traces",
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to store traces: {str(exc)}")
+
+
 @router.post(
     "/traces/init",
     response_model=TraceIngestResponse,
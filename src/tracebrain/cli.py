@@ -31,6 +31,7 @@ import subprocess
 import time
 import os
 from importlib import metadata
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
 import typer
@@ -503,6 +504,14 @@ def status():
 # ============================================================================
 
 
+def _resolve_server_impl(choice: str, fast_impl: str, fallback: str) -> str:
+    """Resolve an "auto" uvicorn loop/http choice to the fastest installed implementation."""
+    choice = choice.lower()
+    if choice != "auto":
+        return choice
+    return fast_impl if find_spec(fast_impl) is not None else fallback
+
+
 @app.command()
 def start(
     host: Optional[str] = typer.Option(
@@ -532,7 +541,17 @@ def start(
         "--workers",
         "-w",
         help="Number of worker processes (default: 1)",
-    )
+    ),
+    loop: str = typer.Option(
+        "auto",
+        "--loop",
+        help="Event loop implementation (auto, asyncio, uvloop)",
+    ),
+    http: str = typer.Option(
+        "auto",
+        "--http",
+        help="HTTP protocol implementation (auto, h11, httptools)",
+    ),
 ):
     """
     Start the TraceBrain API server.
@@ -544,11 +563,15 @@ def start(
         tracebrain start
         tracebrain start --host 0.0.0.0 --port 8080
         tracebrain start --reload --log-level debug
+        tracebrain start --loop asyncio --http h11
     """
     # Use provided values or fall back to settings
     server_host = host or settings.HOST
     server_port = port or settings.PORT
     server_log_level = (log_level or settings.LOG_LEVEL).lower()
+    # uvloop and httptools ship with uvicorn[standard]; fall back where they are unavailable
+    server_loop = _resolve_server_impl(loop, "uvloop", "asyncio")
+    server_http = _resolve_server_impl(http, "httptools", "h11")
     
     typer.echo("=" * 70)
     typer.echo("TraceBrain - Starting API Server")
@@ -560,6 +583,8 @@ def start(
     typer.echo(f"Log Level:      {server_log_level}")
     typer.echo(f"Reload:         {reload}")
     typer.echo(f"Workers:        {workers}")
+    typer.echo(f"Event Loop:     {server_loop}")
+    typer.echo(f"HTTP Protocol:  {server_http}")
     typer.echo("")
     typer.echo(f"-> API Docs:     http://{server_host}:{server_port}/docs")
     typer.echo(f"-> Frontend:     http://{server_host}:{server_port}/")
@@ -576,6 +601,8 @@ def start(
             reload=reload,
             log_level=server_log_level,
             workers=workers,
+            loop=server_loop,
+            http=server_http,
         )
     except KeyboardInterrupt:
         typer.echo("\n\nServer stopped by user")
@@ -633,8 +660,7 @@ def init_db(
         typer.echo("Database tables created successfully")
         typer.echo("")
         store = TraceStore(backend=settings.get_backend_type(), db_url=settings.DATABASE_URL)
-        existing = store.count_traces()
-        if existing == 0:
+        if store.is_empty():
             prompt = typer.style(
                 "Database is empty. Would you like to seed 20 sample traces for a better initial experience?",
                 fg=typer.colors.GREEN,
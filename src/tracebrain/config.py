@@ -11,6 +11,7 @@ Usage:
     app.run(host=settings.HOST, port=settings.PORT)
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -20,6 +21,16 @@ from pydantic import Field, field_validator, model_validator
 load_dotenv()
 
 
+@lru_cache(maxsize=8)
+def _backend_type_for_url(database_url: str) -> str:
+    if database_url.startswith("sqlite"):
+        return "sqlite"
+    if database_url.startswith("postgresql"):
+        return "postgres"
+    # Default to sqlite for unknown/unsupported backends
+    return "sqlite"
+
+
 class Settings(BaseSettings):
     """
     Application settings and configuration.
@@ -86,6 +97,10 @@ class Settings(BaseSettings):
         ge=60,
         description="Recycle DB connections after N seconds"
     )
+    SQLITE_FAST_WRITES: bool = Field(
+        default=True,
+        description="Enable WAL journaling and write-tuned PRAGMAs on SQLite connections"
+    )
     
     # Embedding Configuration
     EMBEDDING_PROVIDER: str = Field(
@@ -200,16 +215,13 @@ class Settings(BaseSettings):
         """
         Determine the storage backend type from DATABASE_URL.
         
+        The result is cached per URL, so repeated calls on hot paths are free
+        while a reassigned DATABASE_URL is still picked up.
+
         Returns:
             str: "sqlite" or "postgres"
         """
-        if self.is_sqlite:
-            return "sqlite"
-        elif self.is_postgres:
-            return "postgres"
-        else:
-            # Default to sqlite for unknown/unsupported backends
-            return "sqlite"
+        return _backend_type_for_url(self.DATABASE_URL)
 
 
 # Global settings instance
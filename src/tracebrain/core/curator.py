@@ -18,6 +18,24 @@ from tracebrain.db.base import Trace, CurriculumTask, TraceStatus
 
 logger = logging.getLogger(__name__)
 
+# Substrings in a tool output that mark it as a failed call
+_TOOL_ERROR_MARKERS = (
+    "error",
+    "exception",
+    "failed",
+    "failure",
+    "timeout",
+    "timed out",
+    "rate limit",
+    "unauthorized",
+    "forbidden",
+    "not found",
+    "invalid",
+    "traceback",
+    "stack trace",
+)
+_HTTP_ERROR_STATUS_RE = re.compile(r"\b[4-5]\d{2}\b")
+
 
 class CurriculumCurator:
     VALID_ERROR_TYPES = {
@@ -149,23 +167,8 @@ class CurriculumCurator:
                         tool_usage.append(f"Tool: {tool_name}")
 
                     lower_output = tool_output.lower()
-                    error_markers = (
-                        "error",
-                        "exception",
-                        "failed",
-                        "failure",
-                        "timeout",
-                        "timed out",
-                        "rate limit",
-                        "unauthorized",
-                        "forbidden",
-                        "not found",
-                        "invalid",
-                        "traceback",
-                        "stack trace",
-                    )
-                    has_error_marker = any(marker in lower_output for marker in error_markers)
-                    has_status_code = re.search(r"\b[4-5]\d{2}\b", tool_output) is not None
+                    has_error_marker = any(marker in lower_output for marker in _TOOL_ERROR_MARKERS)
+                    has_status_code = _HTTP_ERROR_STATUS_RE.search(tool_output) is not None
                     if has_error_marker or has_status_code:
                         error_details.append(f"Tool Error: {tool_output}")
 
@@ -174,17 +177,15 @@ class CurriculumCurator:
                     error_details.append(f"Span Error: {desc}")
 
             status = trace.status.value if hasattr(trace.status, "value") else str(trace.status)
-            summary_line = (
-                f"Trace ID: {trace.id[-6:]} | Status: {status} | Error Type: {error_type}"
-            )
+            summary_parts = [f"Trace ID: {trace.id[-6:]} | Status: {status} | Error Type: {error_type}"]
             if feedback_comment:
-                summary_line += f" | Human Feedback: {feedback_comment}"
+                summary_parts.append(f"Human Feedback: {feedback_comment}")
             if tool_usage:
-                summary_line += f" | Actions: {', '.join(tool_usage)}"
+                summary_parts.append(f"Actions: {', '.join(tool_usage)}")
             if error_details:
-                summary_line += f" | ERRORS FOUND: {'; '.join(error_details)}"
+                summary_parts.append(f"ERRORS FOUND: {'; '.join(error_details)}")
 
-            lines.append(summary_line)
+            lines.append(" | ".join(summary_parts))
 
         return "\n".join(lines)
 
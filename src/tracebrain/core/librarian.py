@@ -7,11 +7,16 @@ memory, self-correction, and interactive abstention.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 import logging
 import re
+import threading
+import time
 
 import sqlparse
 
@@ -22,8 +27,34 @@ from tracebrain.db.base import TraceStatus
 
 logger = logging.getLogger(__name__)
 
-
+# Seconds a tool result is reused for identical arguments. SQL results are never
+# cached: counts and statuses must reflect ingest and feedback written moments ago,
+# and nothing ties cache entries to store writes. Similarity search only surfaces
+# rated experiences, which change slowly relative to a chat session.
+_TOOL_RESULT_TTLS = {
+    "search_similar_traces": 60.0,
+}
+_TOOL_CACHE_MAXSIZE = 256
+_MAX_PARALLEL_TOOL_CALLS = 4
+# Distinct trace IDs taken from a free-text answer; the scan stops once reached
+_MAX_EXTRACTED_SOURCES = 32
+# Stored as the assistant turn when a query fails for an unexpected reason
+_GENERIC_ERROR_ANSWER = (
+    "Sorry, I encountered an error processing your query. "
+    "Please try rephrasing your question or check the server logs."
+)
+
+# Patterns applied to every model reply
+_TRACE_ID_RE = re.compile(r"[a-fA-F0-9]{32}")
+_JSON_FENCE_RE = re.compile(r"^```(json)?", re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_SQL_FENCE_RE = re.compile(r"```(?:sql)?\s*(.*?)```", re.IGNORECASE | re.DOTALL)
+_SELECT_RE = re.compile(r"SELECT\s+.*", re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=1)
 def _build_tool_specs() -> List[Dict[str, Any]]:
+    # Built once and shared by every agent; callers must treat it as read-only.
     return [
         {
             "name": "run_sql_query",
@@ -179,12 +210,67 @@ def _validate_filters(filters: dict) -> dict:
 
     return cleaned
 
+class _ToolResultCache:
+    """Thread-safe LRU cache of tool results with per-entry expiry."""
+
+    def __init__(self, maxsize: int = _TOOL_CACHE_MAXSIZE):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, str], value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class LibrarianAgent:
     """Text-to-SQL agent with conversational memory and self-correction."""
 
     def __init__(self, store):
         self.store = store
         self.tools = _build_tool_specs()
+        self._tool_cache = _ToolResultCache()
+        # Per-tool adapters from the model's raw argument dict, resolved once
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            "run_sql_query": self._handle_run_sql_query,
+            "search_similar_traces": self._handle_search_similar_traces,
+            "set_api_filters": self._handle_set_api_filters,
+        }
+
+    def clear_tool_cache(self) -> None:
+        """Drop cached tool results, e.g. after bulk writes that must be visible at once."""
+        self._tool_cache.clear()
+
+    def _cached_tool_result(self, tool_name: str, args: Dict[str, Any], compute: Callable[[], str]) -> str:
+        key = (tool_name, json.dumps(args, sort_keys=True, default=str))
+        cached = self._tool_cache.get(key)
+        if cached is not None:
+            logger.debug("Librarian tool cache hit for %s", tool_name)
+            return cached
+        result = compute()
+        # Failures may be transient (locks, timeouts), so only successes are reused
+        if not result.startswith("EXECUTION_FAILED"):
+            self._tool_cache.put(key, result, _TOOL_RESULT_TTLS[tool_name])
+        return result
 
     def _schema_context(self) -> str:
         ai_eval_key = TraceBrainAttributes.AI_EVALUATION.value
@@ -340,23 +426,28 @@ class LibrarianAgent:
 
         cleaned = text.strip()
         if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```(json)?", "", cleaned, flags=re.IGNORECASE).strip()
+            cleaned = _JSON_FENCE_RE.sub("", cleaned).strip()
             if cleaned.endswith("```"):
                 cleaned = cleaned[:-3].strip()
 
         try:
             return json.loads(cleaned)
         except json.JSONDecodeError:
-            match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
+            match = _JSON_OBJECT_RE.search(cleaned)
             if not match:
                 raise
             return json.loads(match.group(0))
 
     def _extract_sources(self, answer: str) -> List[str]:
-        if not isinstance(answer, str) or not answer:
+        if not isinstance(answer, str) or len(answer) < 32:
+            # Too short to hold a single trace ID
             return []
-        potential_ids = re.findall(r"[a-fA-F0-9]{32}", answer)
-        return list(dict.fromkeys(potential_ids))
+        seen: Dict[str, None] = {}
+        for match in _TRACE_ID_RE.finditer(answer):
+            seen[match.group(0)] = None
+            if len(seen) >= _MAX_EXTRACTED_SOURCES:
+                break
+        return list(seen)
 
     def run_sql_query(self, sql_query: str) -> str:
         """Executes a READ-ONLY SQL query on the TraceStore."""
@@ -468,7 +559,8 @@ class LibrarianAgent:
             _append_candidate(sources)
 
         if not normalized:
-            normalized = self._extract_sources(answer)
+            # Already de-duplicated in first-seen order
+            return self._extract_sources(answer)
         return list(dict.fromkeys(normalized))
     
     def _normalize_filters(self, filters: Any) -> Dict[str, Any]:
@@ -487,7 +579,7 @@ class LibrarianAgent:
                 return str(sql).strip()
         except Exception:
             pass
-        match = re.search(r"```(?:sql)?\s*(.*?)```", text, flags=re.IGNORECASE | re.DOTALL)
+        match = _SQL_FENCE_RE.search(text)
         candidate = match.group(1).strip() if match else text
 
         statements = sqlparse.parse(candidate)
@@ -495,12 +587,50 @@ class LibrarianAgent:
             if statement.get_type() == "SELECT":
                 return str(statement).strip()
 
-        fallback = re.search(r"SELECT\s+.*", candidate, flags=re.IGNORECASE | re.DOTALL)
+        fallback = _SELECT_RE.search(candidate)
         return fallback.group(0).strip() if fallback else None
 
     def search_similar_traces(self, query: str, min_rating: int = 4, limit: int = 3) -> str:
-        results = self.store.search_similar_experiences(query, min_rating=min_rating, limit=limit)
-        return json.dumps(results, default=str)
+        def search() -> str:
+            results = self.store.search_similar_experiences(query, min_rating=min_rating, limit=limit)
+            return json.dumps(results, default=str)
+
+        return self._cached_tool_result(
+            "search_similar_traces",
+            {"query": query, "min_rating": min_rating, "limit": limit},
+            search,
+        )
+
+    def _handle_run_sql_query(self, args: Dict[str, Any]) -> str:
+        return self.run_sql_query(args.get("query", ""))
+
+    def _handle_search_similar_traces(self, args: Dict[str, Any]) -> str:
+        return self.search_similar_traces(
+            args.get("query", ""),
+            min_rating=int(args.get("min_rating", 4)),
+            limit=int(args.get("limit", 3)),
+        )
+
+    @staticmethod
+    def _handle_set_api_filters(args: Dict[str, Any]) -> str:
+        return "FILTERS_SET"
+
+    def _run_tool(self, tool_name: Optional[str], args: Dict[str, Any]) -> str:
+        handler = self._tool_handlers.get(tool_name)
+        return handler(args) if handler is not None else "UNKNOWN_TOOL"
+
+    def _execute_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[str]:
+        """Run the tool calls from one model turn, concurrently when there are several.
+
+        Tools are read-only lookups, so running them ahead of sending results
+        back is safe; results are returned in call order.
+        """
+        if len(tool_calls) < 2:
+            return [self._run_tool(call.get("name"), call.get("args") or {}) for call in tool_calls]
+        with ThreadPoolExecutor(max_workers=min(len(tool_calls), _MAX_PARALLEL_TOOL_CALLS)) as executor:
+            return list(
+                executor.map(lambda call: self._run_tool(call.get("name"), call.get("args") or {}), tool_calls)
+            )
 
     def query(self, user_query: str, session_id: str) -> Dict[str, Any]:
         """Process a natural language query using the configured provider.
@@ -597,40 +727,50 @@ class LibrarianAgent:
             session = provider.start_chat(system_prompt, self.tools)
             response = provider.send_user_message(session, user_content)
             extracted_filters = {}
+            previous_signature = None
+            # Bound once; the loop below can run up to five rounds of tool calls
+            extract_tool_calls = provider.extract_tool_calls
+            send_tool_result = provider.send_tool_result
+            send_user_message = provider.send_user_message
+            execute_tool_calls = self._execute_tool_calls
+            save_chat_message = self.store.save_chat_message
 
             for _ in range(5):
-                tool_calls = provider.extract_tool_calls(response)
+                tool_calls = extract_tool_calls(response)
                 if not tool_calls:
                     break
 
-                for call in tool_calls:
+                # A model repeating the exact same calls is looping; the results
+                # would not change, so stop instead of spending another round trip.
+                signature = tuple(
+                    (call.get("name"), json.dumps(call.get("args") or {}, sort_keys=True, default=str))
+                    for call in tool_calls
+                )
+                if signature == previous_signature:
+                    logger.debug("Librarian stopping repeated tool calls in session %s", session_id)
+                    break
+                previous_signature = signature
+
+                tool_results = execute_tool_calls(tool_calls)
+                for call, tool_result in zip(tool_calls, tool_results):
                     tool_name = call.get("name")
                     args = call.get("args") or {}
                     if tool_name == "run_sql_query":
-                        sql_query = args.get("query", "")
-                        tool_result = self.run_sql_query(sql_query)
-                        self.store.save_chat_message(
+                        save_chat_message(
                             session_id,
                             "tool",
-                            f"SQL: {sql_query}\nRESULT: {tool_result}",
+                            f"SQL: {args.get('query', '')}\nRESULT: {tool_result}",
                         )
                     elif tool_name == "search_similar_traces":
-                        query = args.get("query", "")
-                        min_rating = int(args.get("min_rating", 4))
-                        limit = int(args.get("limit", 3))
-                        tool_result = self.search_similar_traces(query, min_rating=min_rating, limit=limit)
-                        self.store.save_chat_message(
+                        save_chat_message(
                             session_id,
                             "tool",
-                            f"SEARCH: {query}\nRESULT: {tool_result}",
+                            f"SEARCH: {args.get('query', '')}\nRESULT: {tool_result}",
                         )
                     elif tool_name == "set_api_filters":
                         extracted_filters = args
-                        tool_result = "FILTERS_SET"
-                    else:
-                        tool_result = "UNKNOWN_TOOL"
 
-                    response = provider.send_tool_result(
+                    response = send_tool_result(
                         session,
                         tool_name=tool_name,
                         tool_result=tool_result,
@@ -638,7 +778,7 @@ class LibrarianAgent:
                     )
 
                     if tool_name == "run_sql_query" and tool_result.startswith("EXECUTION_FAILED"):
-                        response = provider.send_user_message(
+                        response = send_user_message(
                             session,
                             (
                                 "The SQL query failed. Use the error message to fix the query. "
@@ -684,21 +824,23 @@ class LibrarianAgent:
             self.store.save_chat_message(session_id, "assistant", result)
             return result
 
-        except Exception as e:
+        except ProviderError as e:
+            # Expected provider failures (auth, rate limits, timeouts) already carry a
+            # user-facing message, so skip formatting a traceback for them.
+            logger.error("Librarian provider error for session %s: %s", session_id, e)
+            self._save_error_result(session_id, str(e))
+            raise
+        except Exception:
             logger.exception("Librarian query failed for session %s", session_id)
-            if isinstance(e, ProviderError):
-                answer = str(e)
-            else:
-                answer = (
-                    "Sorry, I encountered an error processing your query. "
-                    "Please try rephrasing your question or check the server logs."
-                )
-            error_result = {
-                "answer": answer,
-                "suggestions": [],
-                "sources": [],
-                "filters": {},
-                "is_error": True,
-            }
-            self.store.save_chat_message(session_id, "assistant", error_result)
-            raise
\ No newline at end of file
+            self._save_error_result(session_id, _GENERIC_ERROR_ANSWER)
+            raise
+
+    def _save_error_result(self, session_id: str, answer: str) -> None:
+        error_result = {
+            "answer": answer,
+            "suggestions": [],
+            "sources": [],
+            "filters": {},
+            "is_error": True,
+        }
+        self.store.save_chat_message(session_id, "assistant", error_result)
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from functools import lru_cache
+import hashlib
+import importlib
 import logging
 import json
 import os
@@ -14,6 +16,11 @@ import requests
 
 from tracebrain.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -173,10 +180,50 @@ def extract_usage_from_response(provider: str, response: Any) -> Optional[Dict[s
     return None
 
 
+def _parse_tool_args(args_raw: Any) -> Any:
+    """Decode tool-call arguments, using orjson when it is installed; ``{}`` if unparsable."""
+    if not isinstance(args_raw, str):
+        try:
+            return dict(args_raw)
+        except (TypeError, ValueError):
+            return {}
+    if orjson is not None:
+        try:
+            return orjson.loads(args_raw)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; let the stdlib accept what it used to (e.g. NaN).
+            pass
+    try:
+        return json.loads(args_raw)
+    except ValueError:
+        return {}
+
+
 class ProviderError(RuntimeError):
     pass
 
 
+@lru_cache(maxsize=None)
+def _import_sdk(module_name: str) -> Any:
+    """Import an optional SDK module once per process; a failure is cached as its ImportError."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        return exc
+
+
+def _optional_sdk(module_name: str) -> Any:
+    module = _import_sdk(module_name)
+    return None if isinstance(module, ImportError) else module
+
+
+def _require_sdk(module_name: str, error_message: str) -> Any:
+    module = _import_sdk(module_name)
+    if isinstance(module, ImportError):
+        raise ProviderError(error_message) from module
+    return module
+
+
 class BaseProvider:
     name = "base"
     supports_tools = False
@@ -195,6 +242,17 @@ class BaseProvider:
     def send_tool_result(self, session, tool_name: str, tool_result: str, tool_call_id: Optional[str]):
         raise NotImplementedError
 
+    def stream_user_message(self, session, content: str) -> Iterator[str]:
+        """Send a user message and yield the reply text as it arrives.
+
+        The session is updated exactly as send_user_message would update it once
+        the stream is exhausted. Providers without streaming yield one chunk.
+        """
+        response = self.send_user_message(session, content)
+        text = self.extract_text(response)
+        if text:
+            yield text
+
     def extract_text(self, response) -> str:
         raise NotImplementedError
 
@@ -223,13 +281,9 @@ class BaseProvider:
         if isinstance(exc, requests.exceptions.Timeout):
             return True
 
-        try:
-            import httpx
-
-            if isinstance(exc, httpx.TimeoutException):
-                return True
-        except Exception:
-            pass
+        httpx = _optional_sdk("httpx")
+        if httpx is not None and isinstance(exc, httpx.TimeoutException):
+            return True
 
         return False
 
@@ -240,6 +294,7 @@ class BaseProvider:
         # Walk wrapped exception chain (SDK wrappers often store the root cause in __cause__).
         seen: set[int] = set()
         cursor: Optional[BaseException] = exc
+        httpx = _optional_sdk("httpx")
         while cursor is not None and id(cursor) not in seen:
             seen.add(id(cursor))
 
@@ -250,29 +305,20 @@ class BaseProvider:
             if class_name in {"apiconnectionerror", "connecterror", "connectionerror"}:
                 return True
 
-            try:
-                import httpx
-
-                if isinstance(cursor, (httpx.ConnectError, httpx.NetworkError)):
-                    return True
-            except Exception:
-                pass
+            if httpx is not None and isinstance(cursor, (httpx.ConnectError, httpx.NetworkError)):
+                return True
 
             cursor = getattr(cursor, "__cause__", None) or getattr(cursor, "__context__", None)
 
         return False
 
     def _friendly_error_message(self, exc: Exception, endpoint_url: Optional[str] = None) -> str:
-        try:
-            from google.api_core.exceptions import ResourceExhausted
-
-            if isinstance(exc, ResourceExhausted):
-                return (
-                    "System is busy. Too many requests to the AI provider. "
-                    "Please wait a minute or switch models."
-                )
-        except Exception:
-            pass
+        google_exceptions = _optional_sdk("google.api_core.exceptions")
+        if google_exceptions is not None and isinstance(exc, google_exceptions.ResourceExhausted):
+            return (
+                "System is busy. Too many requests to the AI provider. "
+                "Please wait a minute or switch models."
+            )
 
         if self._is_timeout(exc):
             return "The AI is taking too long to think. Please try again or use a smaller model."
@@ -320,25 +366,30 @@ class OpenAIProvider(BaseProvider):
     name = "openai"
     supports_tools = True
 
+    # Tool outputs older than the last few messages are resent as a short stub,
+    # so long sessions do not re-upload every earlier result on each turn.
+    _TOOL_OUTPUT_WINDOW = 6
+    _TOOL_OUTPUT_MAX_CHARS = 2000
+
     def __init__(self, api_key: Optional[str], model: str, base_url: Optional[str] = None):
         super().__init__()
-        try:
-            from openai import OpenAI, APIStatusError, BadRequestError, NotFoundError
-        except ImportError as exc:
-            raise ProviderError("openai SDK not available") from exc
+        openai = _require_sdk("openai", "openai SDK not available")
         self.base_url = str(base_url).strip().rstrip("/") if base_url else None
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
-        self._NotFoundError = NotFoundError
-        self._BadRequestError = BadRequestError
-        self._APIStatusError = APIStatusError
+        self._NotFoundError = openai.NotFoundError
+        self._BadRequestError = openai.BadRequestError
+        self._APIStatusError = openai.APIStatusError
         self._responses_supported: Optional[bool] = None
 
     def start_chat(self, system_instruction: str, tools: List[Dict[str, Any]]):
+        # Tools are fixed for a session, so both API payload shapes are built once here.
         return {
             "system": system_instruction,
             "messages": [],
             "tools": tools,
+            "responses_tools": self._build_responses_tool_specs(tools),
+            "chat_tools": self._build_chat_tool_specs(tools),
             "tool_call_names": {},
         }
 
@@ -668,8 +719,25 @@ class OpenAIProvider(BaseProvider):
                 normalized.append(message)
         return normalized
 
+    def _trim_tool_outputs(self, messages: List[Dict[str, Any]]) -> None:
+        """Replace large tool outputs outside the recent window with a digest stub, in place."""
+        for message in messages[:-self._TOOL_OUTPUT_WINDOW]:
+            if not isinstance(message, dict):
+                continue
+            if message.get("type") == "function_call_output":
+                field = "output"
+            elif message.get("role") == "tool":
+                field = "content"
+            else:
+                continue
+            value = message.get(field)
+            if isinstance(value, str) and len(value) > self._TOOL_OUTPUT_MAX_CHARS:
+                digest = hashlib.sha1(value.encode("utf-8")).hexdigest()[:8]
+                message[field] = f"[earlier tool output omitted: {len(value)} chars, sha1={digest}]"
+
     def _send_response(self, session):
-        tool_specs = self._build_responses_tool_specs(session.get("tools", []))
+        self._trim_tool_outputs(session["messages"])
+        tool_specs = session["responses_tools"]
 
         request_kwargs: Dict[str, Any] = {
             "model": self.model,
@@ -707,7 +775,7 @@ class OpenAIProvider(BaseProvider):
             "messages": self._to_chat_messages(session),
             "temperature": self.temperature,
         }
-        chat_tools = self._build_chat_tool_specs(session.get("tools", []))
+        chat_tools = session["chat_tools"]
         if chat_tools:
             chat_request_kwargs["tools"] = chat_tools
             chat_request_kwargs["tool_choice"] = "auto"
@@ -727,6 +795,54 @@ class OpenAIProvider(BaseProvider):
         session["messages"].append({"role": "user", "content": content})
         return self._send_response(session)
 
+    def stream_user_message(self, session, content: str) -> Iterator[str]:
+        session["messages"].append({"role": "user", "content": content})
+        self._trim_tool_outputs(session["messages"])
+
+        request_kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": self._to_chat_messages(session),
+            "temperature": self.temperature,
+            "stream": True,
+        }
+        if session["chat_tools"]:
+            request_kwargs["tools"] = session["chat_tools"]
+            request_kwargs["tool_choice"] = "auto"
+        if self.max_tokens is not None:
+            request_kwargs["max_tokens"] = self.max_tokens
+
+        text_parts: List[str] = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        try:
+            for chunk in self.client.chat.completions.create(**request_kwargs):
+                choices = getattr(chunk, "choices", None) or []
+                if not choices:
+                    continue
+                delta = choices[0].delta
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield delta.content
+                # Tool call arguments arrive in fragments keyed by the call index
+                for call_delta in delta.tool_calls or []:
+                    call = tool_calls.setdefault(
+                        call_delta.index,
+                        {"id": None, "function": {"name": "", "arguments": ""}},
+                    )
+                    if call_delta.id:
+                        call["id"] = call_delta.id
+                    if call_delta.function is not None:
+                        call["function"]["name"] += call_delta.function.name or ""
+                        call["function"]["arguments"] += call_delta.function.arguments or ""
+        except Exception as exc:
+            self._raise_provider_error(exc, "OpenAI", endpoint_url=self.base_url)
+            raise
+
+        message = {
+            "content": "".join(text_parts),
+            "tool_calls": [tool_calls[index] for index in sorted(tool_calls)],
+        }
+        self._append_chat_completion_to_session(session, {"choices": [{"message": message}]})
+
     def send_tool_result(self, session, tool_name: str, tool_result: str, tool_call_id: Optional[str]):
         if not isinstance(tool_result, str):
             tool_result = json.dumps(tool_result)
@@ -772,11 +888,7 @@ class OpenAIProvider(BaseProvider):
                 or []
             )
         result: List[Dict[str, Any]] = []
-
-        def _read(item: Any, key: str) -> Any:
-            if isinstance(item, dict):
-                return item.get(key)
-            return getattr(item, key, None)
+        _read = self._read_output_field
 
         for item in output_items:
             item_type = _read(item, "type")
@@ -792,10 +904,7 @@ class OpenAIProvider(BaseProvider):
                 or _read(fn_payload, "args")
                 or "{}"
             )
-            try:
-                args = json.loads(args_raw) if isinstance(args_raw, str) else dict(args_raw)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                args = {}
+            args = _parse_tool_args(args_raw)
 
             call_id = _read(item, "call_id") or _read(item, "id") or _read(fn_payload, "call_id")
             if not name:
@@ -827,10 +936,7 @@ class OpenAIProvider(BaseProvider):
             call_id = self._read_chat_field(call, "id")
             if not name:
                 continue
-            try:
-                args = json.loads(args_raw) if isinstance(args_raw, str) else dict(args_raw)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                args = {}
+            args = _parse_tool_args(args_raw)
 
             normalized_tool_calls.append(
                 {
@@ -891,11 +997,8 @@ class AzureOpenAIProvider(OpenAIProvider):
 
     def __init__(self, api_key: Optional[str], model: str, base_url: str, api_version: str):
         super().__init__(api_key=api_key, model=model, base_url=base_url)
-        try:
-            from openai import AzureOpenAI
-        except ImportError as exc:
-            raise ProviderError("openai SDK not available") from exc
-        self.client = AzureOpenAI(
+        openai = _require_sdk("openai", "openai SDK not available")
+        self.client = openai.AzureOpenAI(
             api_key=api_key,
             azure_endpoint=base_url,
             api_version=api_version,
@@ -910,16 +1013,18 @@ class AnthropicProvider(BaseProvider):
 
     def __init__(self, api_key: Optional[str], model: str, base_url: Optional[str] = None):
         super().__init__()
-        try:
-            from anthropic import Anthropic
-        except ImportError as exc:
-            raise ProviderError("anthropic SDK not available") from exc
+        anthropic = _require_sdk("anthropic", "anthropic SDK not available")
         self.base_url = str(base_url).strip().rstrip("/") if base_url else None
-        self.client = Anthropic(api_key=api_key, base_url=base_url)
+        self.client = anthropic.Anthropic(api_key=api_key, base_url=base_url)
         self.model = model
 
     def start_chat(self, system_instruction: str, tools: List[Dict[str, Any]]):
-        return {"system": system_instruction, "messages": [], "tools": tools}
+        return {
+            "system": system_instruction,
+            "messages": [],
+            "tools": tools,
+            "formatted_tools": self._format_tools(tools),
+        }
 
     def _format_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         formatted: List[Dict[str, Any]] = []
@@ -978,7 +1083,7 @@ class AnthropicProvider(BaseProvider):
                 model=self.model,
                 system=session["system"],
                 messages=session["messages"],
-                tools=self._format_tools(session.get("tools", [])),
+                tools=session["formatted_tools"],
                 temperature=self.temperature,
                 max_tokens=self.max_tokens or 512,
             )
@@ -988,6 +1093,25 @@ class AnthropicProvider(BaseProvider):
         self._append_assistant_response(session, response)
         return response
 
+    def stream_user_message(self, session, content: str) -> Iterator[str]:
+        session["messages"].append({"role": "user", "content": content})
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                system=session["system"],
+                messages=session["messages"],
+                tools=session["formatted_tools"],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens or 512,
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+                response = stream.get_final_message()
+        except Exception as exc:
+            self._raise_provider_error(exc, "Anthropic", endpoint_url=self.base_url)
+            raise
+        self._append_assistant_response(session, response)
+
     def send_tool_result(self, session, tool_name: str, tool_result: str, tool_call_id: Optional[str]):
         if not isinstance(tool_result, str):
             tool_result = json.dumps(tool_result)
@@ -1015,7 +1139,7 @@ class AnthropicProvider(BaseProvider):
                 model=self.model,
                 system=session["system"],
                 messages=session["messages"],
-                tools=self._format_tools(session.get("tools", [])),
+                tools=session["formatted_tools"],
                 temperature=self.temperature,
                 max_tokens=self.max_tokens or 512,
             )
@@ -1080,11 +1204,8 @@ class GeminiProvider(BaseProvider):
 
     def __init__(self, api_key: Optional[str], model: str):
         super().__init__()
-        try:
-            from google import genai
-            from google.genai import types
-        except ImportError as exc:
-            raise ProviderError("google-genai not available") from exc
+        genai = _require_sdk("google.genai", "google-genai not available")
+        types = _require_sdk("google.genai.types", "google-genai not available")
         if not api_key:
             raise ProviderError("GEMINI_API_KEY is required for gemini")
         self.client = genai.Client(api_key=api_key)
@@ -1277,29 +1398,31 @@ class HuggingFaceProvider(BaseProvider):
         self.base_url = normalized_base_url.rstrip("/") if normalized_base_url else None
         self.timeout = max(self.timeout, 90)
 
-        try:
-            from huggingface_hub import InferenceClient
-        except ImportError as exc:
-            raise ProviderError("huggingface_hub SDK not available") from exc
+        huggingface_hub = _require_sdk("huggingface_hub", "huggingface_hub SDK not available")
 
         if self.base_url:
-            self.client = InferenceClient(
+            self.client = huggingface_hub.InferenceClient(
                 base_url=self.base_url,
                 token=self.api_key,
                 timeout=self.timeout,
             )
         else:
-            self.client = InferenceClient(
+            self.client = huggingface_hub.InferenceClient(
                 model=self.model,
                 token=self.api_key,
                 timeout=self.timeout,
             )
 
-        self._tools: List[Dict[str, Any]] = []
-
     def start_chat(self, system_instruction: str, tools: List[Dict[str, Any]]):
-        self._tools = self._format_tools(tools)
-        return {"system": system_instruction, "history": []}
+        # Formatted tools live on the session so concurrent chats sharing this
+        # provider cannot overwrite each other's tool set.
+        # The system message leads the list so each turn sends it as-is instead of
+        # copying the whole history into a fresh list.
+        return {
+            "system": system_instruction,
+            "messages": [{"role": "system", "content": system_instruction}],
+            "tools": self._format_tools(tools),
+        }
 
     def _format_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         formatted: List[Dict[str, Any]] = []
@@ -1321,7 +1444,7 @@ class HuggingFaceProvider(BaseProvider):
             formatted.append({"type": "function", "function": function_payload})
         return formatted
 
-    def _create_completion(self, messages: List[Dict[str, Any]]):
+    def _create_completion(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]):
         kwargs: Dict[str, Any] = {
             "messages": messages,
             "temperature": self.temperature,
@@ -1329,15 +1452,15 @@ class HuggingFaceProvider(BaseProvider):
         kwargs.pop("timeout", None)
         if self.max_tokens is not None:
             kwargs["max_tokens"] = self.max_tokens
-        if self._tools:
-            kwargs["tools"] = self._tools
+        if tools:
+            kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
         try:
             return self.client.chat.completions.create(**kwargs)
         except Exception as exc:
             status_code = self._extract_status_code(exc)
-            if status_code == 400 and self._tools:
+            if status_code == 400 and tools:
                 logger.warning("HuggingFace tools rejected; retrying without tools: %s", exc)
                 fallback_kwargs = dict(kwargs)
                 fallback_kwargs.pop("tools", None)
@@ -1356,9 +1479,8 @@ class HuggingFaceProvider(BaseProvider):
             raise
 
     def send_user_message(self, session, content: str):
-        session["history"].append({"role": "user", "content": content})
-        messages = [{"role": "system", "content": session["system"]}, *session["history"]]
-        response = self._create_completion(messages)
+        session["messages"].append({"role": "user", "content": content})
+        response = self._create_completion(session["messages"], session.get("tools", []))
 
         assistant_text = self.extract_text(response)
         if not assistant_text.strip():
@@ -1366,13 +1488,13 @@ class HuggingFaceProvider(BaseProvider):
                 "The model is taking longer than expected to load on the free tier. "
                 "Please try again in a few seconds."
             )
-        session["history"].append({"role": "assistant", "content": assistant_text})
+        session["messages"].append({"role": "assistant", "content": assistant_text})
         return response
 
     def send_tool_result(self, session, tool_name: str, tool_result: str, tool_call_id: Optional[str]):
         if not isinstance(tool_result, str):
             tool_result = json.dumps(tool_result)
-        session["history"].append(
+        session["messages"].append(
             {
                 "role": "tool",
                 "tool_call_id": tool_call_id,
@@ -1380,8 +1502,7 @@ class HuggingFaceProvider(BaseProvider):
                 "content": tool_result,
             }
         )
-        messages = [{"role": "system", "content": session["system"]}, *session["history"]]
-        response = self._create_completion(messages)
+        response = self._create_completion(session["messages"], session.get("tools", []))
 
         assistant_text = self.extract_text(response)
         if not assistant_text.strip():
@@ -1389,7 +1510,7 @@ class HuggingFaceProvider(BaseProvider):
                 "The model is taking longer than expected to load on the free tier. "
                 "Please try again in a few seconds."
             )
-        session["history"].append({"role": "assistant", "content": assistant_text})
+        session["messages"].append({"role": "assistant", "content": assistant_text})
         return response
 
     def extract_text(self, response) -> str:
@@ -1468,6 +1589,23 @@ def _looks_local_openai_endpoint(base_url: Optional[str]) -> bool:
     )
 
 
+def _cached_provider(provider_cls: type, *args: Any) -> BaseProvider:
+    """Reuse one provider (and its SDK client) per resolved provider configuration.
+
+    Providers keep per-conversation state in the session returned by
+    ``start_chat``, so a single instance can serve concurrent chats. The
+    settings BaseProvider reads at construction (and SDK clients capture, like
+    the timeout) are part of the key, so changing them yields a fresh provider.
+    """
+    runtime_settings = (settings.LLM_TIMEOUT, settings.LLM_TEMPERATURE, settings.LLM_MAX_TOKENS)
+    return _provider_for_config(provider_cls, runtime_settings, *args)
+
+
+@lru_cache(maxsize=16)
+def _provider_for_config(provider_cls: type, runtime_settings: tuple, *args: Any) -> BaseProvider:
+    return provider_cls(*args)
+
+
 def get_llm_provider(provider_name: str, model_id: str, api_key: Optional[str] = None) -> BaseProvider:
     """Create a provider instance from explicit provider/model settings."""
     provider = (provider_name or "").strip().lower()
@@ -1487,21 +1625,21 @@ def get_llm_provider(provider_name: str, model_id: str, api_key: Optional[str] =
         if provider == "openai" and not resolved_api_key:
             resolved_api_key = _require_api_key("openai", api_key)
 
-        return OpenAIProvider(api_key=resolved_api_key or None, model=model, base_url=base_url)
+        return _cached_provider(OpenAIProvider, resolved_api_key or None, model, base_url)
 
     if provider == "gemini":
         resolved_api_key = _require_api_key("gemini", api_key)
-        return GeminiProvider(api_key=resolved_api_key, model=model)
+        return _cached_provider(GeminiProvider, resolved_api_key, model)
 
     if provider == "anthropic":
         resolved_api_key = _require_api_key("anthropic", api_key)
         base_url = os.getenv("ANTHROPIC_BASE_URL") or settings.LLM_BASE_URL
-        return AnthropicProvider(api_key=resolved_api_key, model=model, base_url=base_url)
+        return _cached_provider(AnthropicProvider, resolved_api_key, model, base_url)
 
     if provider in {"huggingface", "hf"}:
         resolved_api_key = _require_api_key("huggingface", api_key)
         base_url = settings.HUGGINGFACE_BASE_URL
-        return HuggingFaceProvider(api_key=resolved_api_key, model=model, base_url=base_url)
+        return _cached_provider(HuggingFaceProvider, resolved_api_key, model, base_url)
 
     raise ValueError(
         "Unknown provider "
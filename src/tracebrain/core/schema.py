@@ -10,8 +10,11 @@ Usage:
     parsers, adapters, and the TraceStore.
 """
 
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Dict, Any, Optional
+import sys
+import time
+from typing import List, Dict, Any, Final, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 class TraceBrainAttributes(str, Enum):
@@ -57,17 +60,63 @@ class SpanType(str, Enum):
     LLM_INFERENCE = "llm_inference"
     TOOL_EXECUTION = "tool_execution"
 
+# Plain str aliases of the enum values, interned once at import. Dotted names are
+# not interned by the compiler, so keys parsed elsewhere can be passed through
+# sys.intern() to share these objects. Hashing a str-Enum member goes through
+# Enum.__hash__ in Python, so hot loops doing dict lookups should use these
+# rather than the members; schema definitions and docs keep using the Enums.
+SPAN_TYPE: Final[str] = sys.intern(TraceBrainAttributes.SPAN_TYPE.value)
+SYSTEM_PROMPT: Final[str] = sys.intern(TraceBrainAttributes.SYSTEM_PROMPT.value)
+EPISODE_ID: Final[str] = sys.intern(TraceBrainAttributes.EPISODE_ID.value)
+AI_EVALUATION: Final[str] = sys.intern(TraceBrainAttributes.AI_EVALUATION.value)
+LLM_NEW_CONTENT: Final[str] = sys.intern(TraceBrainAttributes.LLM_NEW_CONTENT.value)
+LLM_COMPLETION: Final[str] = sys.intern(TraceBrainAttributes.LLM_COMPLETION.value)
+LLM_THOUGHT: Final[str] = sys.intern(TraceBrainAttributes.LLM_THOUGHT.value)
+LLM_TOOL_CODE: Final[str] = sys.intern(TraceBrainAttributes.LLM_TOOL_CODE.value)
+LLM_FINAL_ANSWER: Final[str] = sys.intern(TraceBrainAttributes.LLM_FINAL_ANSWER.value)
+USAGE: Final[str] = sys.intern(TraceBrainAttributes.USAGE.value)
+TOOL_NAME: Final[str] = sys.intern(TraceBrainAttributes.TOOL_NAME.value)
+TOOL_INPUT: Final[str] = sys.intern(TraceBrainAttributes.TOOL_INPUT.value)
+TOOL_OUTPUT: Final[str] = sys.intern(TraceBrainAttributes.TOOL_OUTPUT.value)
+AI_CONFIDENCE: Final[str] = sys.intern(TraceBrainAttributes.AI_CONFIDENCE.value)
+AI_RATING: Final[str] = sys.intern(TraceBrainAttributes.AI_RATING.value)
+AI_STATUS: Final[str] = sys.intern(TraceBrainAttributes.AI_STATUS.value)
+AI_FEEDBACK: Final[str] = sys.intern(TraceBrainAttributes.AI_FEEDBACK.value)
+AI_ERROR_TYPE: Final[str] = sys.intern(TraceBrainAttributes.AI_ERROR_TYPE.value)
+
+LLM_INFERENCE: Final[str] = sys.intern(SpanType.LLM_INFERENCE.value)
+TOOL_EXECUTION: Final[str] = sys.intern(SpanType.TOOL_EXECUTION.value)
+
+# Most traces accepted by one POST /api/v1/traces/batch request; the SDK clamps
+# its async batch size to this.
+MAX_TRACE_BATCH_SIZE: Final[int] = 1000
+
 # --- Pydantic Models for Validation ---
 
+# Span IDs are OTLP lowercase hex. pydantic-core compiles these patterns once and
+# checks them natively during validation.
+# Trace IDs stay free-form: bundled samples and existing stores use non-hex IDs.
+_SPAN_ID_PATTERN = r"^[0-9a-f]{16}$"
+# ISO 8601 timestamps as the TraceStore parses them on ingest: the offset is
+# optional (naive times are read as-is) and may omit the colon. Shared with
+# TraceStore._parse_timestamp so client and server validation agree.
+ISO_TIMESTAMP_PATTERN: Final[str] = (
+    r"^(?P<base>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?P<frac>\.\d+)?(?P<tz>Z|[+-]\d{2}:?\d{2})?$"
+)
+
 class Span(BaseModel):
     """
     Represents a single unit of work in the trace (OTLP Span).
     """
-    span_id: str = Field(..., description="Unique 16-char hex identifier for the span")
-    parent_id: Optional[str] = Field(None, description="Parent span ID (null for root)")
+    span_id: str = Field(
+        ..., pattern=_SPAN_ID_PATTERN, description="Unique 16-char hex identifier for the span"
+    )
+    parent_id: Optional[str] = Field(
+        None, pattern=_SPAN_ID_PATTERN, description="Parent span ID (null for root)"
+    )
     name: str = Field(..., description="Human readable name (e.g., 'LLM Inference')")
-    start_time: str = Field(..., description="ISO 8601 UTC timestamp")
-    end_time: str = Field(..., description="ISO 8601 UTC timestamp")
+    start_time: str = Field(..., pattern=ISO_TIMESTAMP_PATTERN, description="ISO 8601 UTC timestamp")
+    end_time: str = Field(..., pattern=ISO_TIMESTAMP_PATTERN, description="ISO 8601 UTC timestamp")
     
     # Attributes hold the semantic data (tracebrain.* fields)
     attributes: Dict[str, Any] = Field(default_factory=dict)
@@ -117,5 +166,25 @@ class Trace(BaseModel):
 
 def get_iso_time_now() -> str:
     """Returns current time in ISO 8601 UTC format."""
-    from datetime import datetime, timezone
-    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
\ No newline at end of file
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+# (monotonic_ns, iso_string) of the last timestamp handed out by
+# get_iso_time_now_cached; a single tuple so readers never see a torn pair.
+_LAST_ISO_TIME = (0, "")
+
+
+def get_iso_time_now_cached(ttl_ns: int = 1_000_000) -> str:
+    """Like get_iso_time_now, but reuses the last value for up to ``ttl_ns``.
+
+    Meant for high-fanout paths that stamp many spans in one go; use
+    get_iso_time_now where each event needs its own precise boundary.
+    """
+    global _LAST_ISO_TIME
+    now_ns = time.monotonic_ns()
+    last_ns, last_iso = _LAST_ISO_TIME
+    if last_iso and now_ns - last_ns < ttl_ns:
+        return last_iso
+    iso = get_iso_time_now()
+    _LAST_ISO_TIME = (now_ns, iso)
+    return iso
\ No newline at end of file
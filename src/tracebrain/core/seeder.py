@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, parsing inline is faster than starting a process pool.
+_PARALLEL_PARSE_MIN_FILES = 64
+_DIGEST_SIZE = 16
+
 
 def get_samples_dir() -> Path:
     """Return the packaged samples directory path."""
@@ -22,47 +29,170 @@ def _iter_sample_files(samples_dir: Path) -> Iterable[Path]:
     return sorted(samples_dir.glob("*.json"))
 
 
-def seed_data(store) -> None:
-    """Seed the TraceStore with bundled sample traces."""
+def _file_digest(sample: Path) -> str:
+    """Return a BLAKE2b digest of the file content."""
+    with sample.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            digest = hashlib.file_digest(handle, lambda: hashlib.blake2b(digest_size=_DIGEST_SIZE))
+        else:
+            digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _select_unseeded(
+    sample_files: List[Path],
+    manifest: Dict[str, Tuple[int, int, str]],
+) -> Tuple[List[Path], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Split sample files into those that still need seeding and those already seeded.
+
+    A file whose size and mtime match the manifest is skipped without being read.
+    A file that was touched but whose content digest is unchanged is skipped too,
+    and its manifest entry is refreshed so the next run can skip it on stat alone.
+
+    Returns:
+        (pending files, manifest entries for pending files, refreshed entries)
+    """
+    pending: List[Path] = []
+    pending_entries: Dict[str, Dict[str, Any]] = {}
+    refreshed: Dict[str, Dict[str, Any]] = {}
+    for sample in sample_files:
+        stat = sample.stat()
+        seen = manifest.get(sample.name)
+        if seen is not None and seen[:2] == (stat.st_size, stat.st_mtime_ns):
+            continue
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": _file_digest(sample)}
+        if seen is not None and seen[2] == entry["digest"]:
+            refreshed[sample.name] = entry
+            continue
+        pending.append(sample)
+        pending_entries[sample.name] = entry
+    return pending, pending_entries, refreshed
+
+
+def _load_sample(sample: Path) -> Optional[Dict[str, Any]]:
+    """Parse one sample trace file, returning None if it cannot be read."""
+    try:
+        logger.info("Loading sample %s...", sample.name)
+        with sample.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except Exception as exc:
+        logger.exception("Failed to load sample trace %s: %s", sample.name, exc)
+        return None
+
+
+def _iter_sample_payloads(
+    sample_files: List[Path],
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """
+    Yield ``(path, parsed trace)`` pairs in file order.
+
+    Large sample sets are parsed in a process pool while the caller stays the
+    single writer to the database. Small sets are parsed inline, where a pool
+    would cost more to start than it saves.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(sample_files) >= _PARALLEL_PARSE_MIN_FILES else 1
+
+    if workers <= 1:
+        payloads: Iterable[Optional[Dict[str, Any]]] = map(_load_sample, sample_files)
+        for sample, payload in zip(sample_files, payloads):
+            if payload is not None:
+                yield sample, payload
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        payloads = executor.map(_load_sample, sample_files, chunksize=8)
+        for sample, payload in zip(sample_files, payloads):
+            if payload is not None:
+                yield sample, payload
+
+
+def seed_data(store, workers: Optional[int] = None) -> None:
+    """
+    Seed the TraceStore with bundled sample traces.
+
+    Files recorded in the store's seed manifest are skipped, so re-running the
+    seeder only reads and inserts new or changed samples.
+
+    Args:
+        store: TraceStore to write into.
+        workers: Number of parser processes. Defaults to the CPU count for large
+            sample sets and inline parsing otherwise.
+    """
     samples_dir = get_samples_dir()
     sample_files = list(_iter_sample_files(samples_dir))
     if not sample_files:
         logger.warning("No sample traces found to seed.")
         return
 
+    sample_files, manifest_entries, refreshed = _select_unseeded(sample_files, store.get_seed_manifest())
+    store.record_seed_manifest(refreshed)
+    if not sample_files:
+        logger.info("All sample traces are already seeded.")
+        return
+
+    trace_files: Dict[str, str] = {}
+
+    def payloads() -> Iterator[Dict[str, Any]]:
+        for sample, payload in _iter_sample_payloads(sample_files, workers=workers):
+            trace_id = payload.get("trace_id")
+            if trace_id:
+                trace_files[trace_id] = sample.name
+            yield payload
+
     success_count = 0
-    failure_count = 0
 
-    for sample in sample_files:
-        try:
-            logger.info("Ingesting sample %s...", sample.name)
-            payload = json.loads(sample.read_text(encoding="utf-8"))
-            store.add_trace_from_dict(payload)
-            success_count += 1
-        except Exception as exc:
-            failure_count += 1
-            logger.exception("Failed to seed sample trace %s: %s", sample.name, exc)
+    def record_batch(stored_ids: List[str]) -> None:
+        # Recorded per committed batch so a later failing batch cannot leave
+        # already-inserted files out of the manifest.
+        nonlocal success_count
+        success_count += len(stored_ids)
+        seeded = {}
+        for trace_id in stored_ids:
+            filename = trace_files.get(trace_id)
+            if filename is not None:
+                seeded[filename] = {**manifest_entries[filename], "trace_id": trace_id}
+        store.record_seed_manifest(seeded)
+
+    # Payloads are parsed lazily so only one insert batch is held in memory.
+    try:
+        store.add_traces_bulk(payloads(), on_batch_stored=record_batch)
+    except Exception as exc:
+        logger.exception("Failed to seed sample traces: %s", exc)
 
     logger.info(
         "Seeding summary: %s succeeded, %s failed (total %s)",
         success_count,
-        failure_count,
+        len(sample_files) - success_count,
         len(sample_files),
     )
 
 
 def seed_if_empty(store) -> None:
-    """Seed the TraceStore if no traces exist."""
+    """
+    Seed the TraceStore if no traces exist.
+
+    A store that already holds seeded samples only receives sample files that
+    are missing from its seed manifest.
+    """
     try:
-        existing = store.count_traces()
+        empty = store.is_empty()
+        manifest = {} if empty else store.get_seed_manifest()
     except Exception:
         logger.exception("Failed to check existing traces")
         return
 
-    if existing and existing > 0:
+    if empty:
+        # Nothing seeded earlier survives, so the manifest is stale.
+        store.clear_seed_manifest()
+        sample_files = list(_iter_sample_files(get_samples_dir()))
+        logger.info("Database is empty. Automatically seeding %s sample traces...", len(sample_files))
+    elif not manifest:
+        logger.info("Database already contains traces; skipping automatic seeding.")
         return
 
-    samples_dir = get_samples_dir()
-    sample_files = list(_iter_sample_files(samples_dir))
-    logger.info("Database is empty. Automatically seeding %s sample traces...", len(sample_files))
     seed_data(store)
@@ -9,6 +9,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List
 import logging
+import threading
 
 from tracebrain.config import settings
 
@@ -23,10 +24,21 @@ class BaseEmbeddingProvider(ABC):
 
 class LocalEmbeddingProvider(BaseEmbeddingProvider):
     def __init__(self) -> None:
+        # The model is loaded on first use: importing sentence-transformers pulls in
+        # torch, which would otherwise slow every TraceStore construction.
         self._model = None
         self._init_error: str | None = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
         self._availability_warning_emitted = False
-        self._load_model()
+
+    def _ensure_model(self):
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_model()
+                    self._loaded = True
+        return self._model
 
     def _load_model(self) -> None:
         try:
@@ -42,7 +54,8 @@ class LocalEmbeddingProvider(BaseEmbeddingProvider):
             self._model = None
 
     def get_embedding(self, text: str) -> List[float]:
-        if not self._model:
+        model = self._ensure_model()
+        if not model:
             if not self._availability_warning_emitted:
                 if self._init_error:
                     logger.warning(
@@ -56,7 +69,7 @@ class LocalEmbeddingProvider(BaseEmbeddingProvider):
                 self._availability_warning_emitted = True
             return []
         try:
-            embedding = self._model.encode([text], normalize_embeddings=True)
+            embedding = model.encode([text], normalize_embeddings=True)
             return embedding[0].tolist()
         except Exception as exc:
             logger.warning("Embedding generation failed: %s", exc)
@@ -5,31 +5,35 @@ This module provides a flexible storage system for agent execution traces,
 supporting both SQLite (for development) and PostgreSQL (for production).
 """
 
+from collections import Counter
 from contextlib import contextmanager
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Iterator, Union
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any, Optional, List, Iterable, Iterator, Tuple, Union
 import logging
 import re
 import json
 import os
 
 import sqlparse
-from sqlalchemy import create_engine, event, func, cast, text, Integer, Float, case, inspect
+from sqlalchemy import create_engine, event, func, cast, text, Integer, Float, and_, or_, case, delete, insert, inspect, select
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.exc import IntegrityError, ProgrammingError, TimeoutError
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError, TimeoutError
 from sqlalchemy.orm import joinedload, sessionmaker, Session, selectinload
 
 from tracebrain.config import settings
+from tracebrain.core.schema import ISO_TIMESTAMP_PATTERN
 from tracebrain.core.services.embedding import EmbeddingFactory
 from tracebrain.db.base import (
     Base,
     Trace,
     Span,
+    TraceIndex,
     ChatSession,
     ChatMessage,
     TraceStatus,
     CurriculumTask,
     History,
+    SeedManifest,
     Settings as DBSettings,
 )
 
@@ -43,6 +47,24 @@ _API_KEY_FIELD_TO_ENV = {
     "huggingface_api_key": "HUGGINGFACE_API_KEY",
 }
 
+# Span columns written by the bulk ingest path, in statement order
+_SPAN_COLUMNS = ("span_id", "trace_id", "parent_id", "name", "start_time", "end_time", "attributes")
+
+# Trace IDs per trace_index refresh statement, well under SQLite's bound-parameter limit
+_TRACE_INDEX_CHUNK = 500
+
+# Episode IDs per trace lookup when listing episodes
+_EPISODE_CHUNK = 500
+
+_SQLITE_FAST_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
 
 class BaseStorageBackend:
     """
@@ -82,8 +104,11 @@ class BaseStorageBackend:
             def set_sqlite_pragma(dbapi_connection, connection_record):
                 cursor = dbapi_connection.cursor()
                 cursor.execute("PRAGMA foreign_keys=ON")
+                if settings.SQLITE_FAST_WRITES:
+                    for pragma in _SQLITE_FAST_WRITE_PRAGMAS:
+                        cursor.execute(pragma)
                 cursor.close()
-                
+
         self.SessionLocal = sessionmaker(
             bind=self.engine,
             autocommit=False,
@@ -100,10 +125,62 @@ class BaseStorageBackend:
         if not self.is_sqlite:
             with self.engine.begin() as connection:
                 connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        # trace_index is maintained on every write once it exists, so only a database
+        # that predates the table needs the (span-table-sized) backfill.
+        trace_index_created = not inspect(self.engine).has_table(TraceIndex.__tablename__)
         Base.metadata.create_all(bind=self.engine)
+        self._ensure_indexes()
         self._ensure_settings_schema()
+        if trace_index_created:
+            self._backfill_trace_index()
         logger.info("Database tables created/verified for %s", self.__class__.__name__)
 
+    def _ensure_indexes(self) -> None:
+        """Create indexes added to existing tables after the database was first created."""
+        inspector = inspect(self.engine)
+        created: List[str] = []
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(bind=self.engine, checkfirst=True)
+                    created.append(index.name)
+        if created:
+            logger.info("Created missing indexes: %s", ", ".join(created))
+
+    def _backfill_trace_index(self) -> None:
+        """Add trace_index rows for traces written before the summary table existed."""
+        indexed = select(TraceIndex.trace_id)
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                insert(TraceIndex).from_select(
+                    ["trace_id", "start_time", "end_time"],
+                    self._trace_index_select().where(Span.trace_id.not_in(indexed)),
+                )
+            )
+        if result.rowcount and result.rowcount > 0:
+            logger.info("Backfilled trace_index for %s traces", result.rowcount)
+
+    @staticmethod
+    def _trace_index_select():
+        """Select (trace_id, earliest root span start, latest span end) from spans."""
+        root_start = func.min(case((Span.parent_id.is_(None), Span.start_time)))
+        return select(Span.trace_id, root_start, func.max(Span.end_time)).group_by(Span.trace_id)
+
+    def _refresh_trace_index(self, session: Session, trace_ids: List[str]) -> None:
+        """Recompute trace_index rows for the given traces inside the caller's transaction."""
+        for offset in range(0, len(trace_ids), _TRACE_INDEX_CHUNK):
+            chunk = trace_ids[offset:offset + _TRACE_INDEX_CHUNK]
+            session.execute(delete(TraceIndex).where(TraceIndex.trace_id.in_(chunk)))
+            session.execute(
+                insert(TraceIndex).from_select(
+                    ["trace_id", "start_time", "end_time"],
+                    self._trace_index_select().where(Span.trace_id.in_(chunk)),
+                )
+            )
+
     def _ensure_settings_schema(self) -> None:
         """Backfill settings columns for existing databases created before new fields existed."""
         inspector = inspect(self.engine)
@@ -164,20 +241,8 @@ class BaseStorageBackend:
         finally:
             session.close()
 
-    def add_trace_from_dict(self, trace_data: Dict[str, Any]) -> str:
-        """
-        Add a trace to the database from a dictionary (parsed JSON).
-
-        Args:
-            trace_data (dict): A dictionary representing a complete trace,
-                conforming to the TraceBrain OTLP schema.
-
-        Returns:
-            str: The trace_id of the inserted trace.
-
-        Raises:
-            ValueError: If the trace_data is invalid or missing required fields.
-        """
+    def _normalize_trace_payload(self, trace_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract and normalize the trace-level fields shared by single and bulk ingest."""
         trace_id = trace_data.get("trace_id")
         if not trace_id:
             raise ValueError("trace_id is required in trace_data")
@@ -224,6 +289,43 @@ class BaseStorageBackend:
                 )
             }
 
+        return {
+            "trace_id": trace_id,
+            "system_prompt": system_prompt,
+            "episode_id": episode_id,
+            "status": status,
+            "priority": priority,
+            "attributes": attributes,
+            "ai_evaluation": ai_evaluation,
+            "needs_review": needs_review,
+            "spans_data": spans_data,
+        }
+
+    def add_trace_from_dict(self, trace_data: Dict[str, Any]) -> str:
+        """
+        Add a trace to the database from a dictionary (parsed JSON).
+
+        Args:
+            trace_data (dict): A dictionary representing a complete trace,
+                conforming to the TraceBrain OTLP schema.
+
+        Returns:
+            str: The trace_id of the inserted trace.
+
+        Raises:
+            ValueError: If the trace_data is invalid or missing required fields.
+        """
+        fields = self._normalize_trace_payload(trace_data)
+        trace_id = fields["trace_id"]
+        system_prompt = fields["system_prompt"]
+        episode_id = fields["episode_id"]
+        status = fields["status"]
+        priority = fields["priority"]
+        attributes = fields["attributes"]
+        ai_evaluation = fields["ai_evaluation"]
+        needs_review = fields["needs_review"]
+        spans_data = fields["spans_data"]
+
         trace = Trace(
             id=trace_id,
             system_prompt=system_prompt,
@@ -243,6 +345,9 @@ class BaseStorageBackend:
         session = self.get_session()
         try:
             session.add(trace)
+            session.flush()
+            if trace.spans:
+                self._refresh_trace_index(session, [trace_id])
             session.commit()
             logger.info("Successfully added trace %s with %s spans", trace_id, len(trace.spans))
             return trace_id
@@ -291,6 +396,8 @@ class BaseStorageBackend:
                     span = self._create_span_from_dict(span_data, trace_id)
                     existing.spans.append(span)
 
+                session.flush()
+                self._refresh_trace_index(session, [trace_id])
                 session.commit()
                 logger.info("Merged trace %s with %s new spans", trace_id, len(spans_data))
                 return trace_id
@@ -302,6 +409,147 @@ class BaseStorageBackend:
         finally:
             session.close()
 
+    def add_traces_bulk(
+        self,
+        traces_data: Iterable[Dict[str, Any]],
+        batch_size: int = 10_000,
+        on_batch_stored: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[str]:
+        """
+        Add many traces using batched executemany inserts.
+
+        Rows are written in one transaction per ``batch_size`` spans instead of
+        one commit per trace. A batch that collides with existing rows is
+        replayed through ``add_trace_from_dict`` so merge semantics are kept.
+
+        Args:
+            traces_data (Iterable[dict]): Trace payloads in the TraceBrain OTLP schema.
+            batch_size (int): Number of spans to accumulate before flushing.
+            on_batch_stored (callable, optional): Called with the trace_ids of each
+                batch once it is committed, so callers can track progress that
+                survives a later batch raising.
+
+        Returns:
+            List[str]: The trace_ids that were stored. Payloads that could not be
+            stored are left out and logged with the reason.
+        """
+        stored_ids: List[str] = []
+        pending: List[Dict[str, Any]] = []
+        trace_rows: List[Dict[str, Any]] = []
+        span_columns: Dict[str, List[Any]] = {name: [] for name in _SPAN_COLUMNS}
+        span_count = 0
+
+        for trace_data in traces_data:
+            try:
+                fields = self._normalize_trace_payload(trace_data)
+                trace_id = fields["trace_id"]
+                rows = [
+                    self._span_row_from_dict(span_data, trace_id)
+                    for span_data in fields["spans_data"]
+                ]
+            except ValueError as exc:
+                logger.warning("Skipping invalid trace payload: %s", exc)
+                continue
+
+            trace_rows.append(
+                {
+                    "id": trace_id,
+                    "system_prompt": fields["system_prompt"],
+                    "episode_id": fields["episode_id"],
+                    "created_at": datetime.utcnow(),
+                    "status": fields["status"],
+                    "priority": fields["priority"],
+                    # Passed explicitly so the JSON columns store JSON null, as the
+                    # ORM path in add_trace_from_dict does; an omitted key is SQL NULL.
+                    "embedding": None,
+                    "attributes": fields["attributes"],
+                    "feedback": None,
+                    "ai_evaluation": fields["ai_evaluation"],
+                }
+            )
+            for name, values in span_columns.items():
+                values.extend(row[name] for row in rows)
+            span_count += len(rows)
+            pending.append(trace_data)
+
+            if span_count >= batch_size:
+                batch_ids = self._flush_trace_batch(trace_rows, span_columns, pending)
+                stored_ids.extend(batch_ids)
+                if on_batch_stored is not None:
+                    on_batch_stored(batch_ids)
+                pending, trace_rows, span_count = [], [], 0
+                span_columns = {name: [] for name in _SPAN_COLUMNS}
+
+        if trace_rows:
+            batch_ids = self._flush_trace_batch(trace_rows, span_columns, pending)
+            stored_ids.extend(batch_ids)
+            if on_batch_stored is not None:
+                on_batch_stored(batch_ids)
+
+        return stored_ids
+
+    def _flush_trace_batch(
+        self,
+        trace_rows: List[Dict[str, Any]],
+        span_columns: Dict[str, List[Any]],
+        traces_data: List[Dict[str, Any]],
+    ) -> List[str]:
+        """Insert one batch of trace and span rows in a single transaction."""
+        span_count = len(span_columns["span_id"])
+        session = self.get_session()
+        try:
+            # Core inserts keep every row's key set identical, so each table is
+            # written with one executemany even when some values are None.
+            session.execute(insert(Trace.__table__), trace_rows)
+            if span_count:
+                self._insert_span_columns(session, span_columns)
+                self._refresh_trace_index(session, [row["id"] for row in trace_rows])
+            session.commit()
+            logger.info("Bulk inserted %s traces with %s spans", len(trace_rows), span_count)
+            return [row["id"] for row in trace_rows]
+        except IntegrityError:
+            session.rollback()
+            logger.info(
+                "Bulk batch of %s traces conflicts with existing rows; ingesting one by one",
+                len(trace_rows),
+            )
+        except Exception:
+            session.rollback()
+            logger.exception("Failed to bulk insert traces")
+            raise
+        finally:
+            session.close()
+
+        stored_ids: List[str] = []
+        for trace_data in traces_data:
+            try:
+                stored_ids.append(self.add_trace_from_dict(trace_data))
+            except Exception as exc:
+                logger.warning("Failed to ingest trace %s: %s", trace_data.get("trace_id"), exc)
+        return stored_ids
+
+    def _insert_span_columns(self, session: Session, span_columns: Dict[str, List[Any]]) -> None:
+        """Write column-oriented span values with a single executemany."""
+        if not self.is_sqlite:
+            session.execute(
+                insert(Span.__table__),
+                [dict(zip(_SPAN_COLUMNS, row)) for row in zip(*span_columns.values())],
+            )
+            return
+
+        # Run each column through its type's bind processor once, then hand the
+        # driver positional tuples instead of per-row parameter dicts.
+        dialect = self.engine.dialect
+        columns = []
+        for name, values in span_columns.items():
+            column_type = Span.__table__.c[name].type
+            processor = column_type.dialect_impl(dialect).bind_processor(dialect)
+            columns.append([processor(value) for value in values] if processor else values)
+        statement = "INSERT INTO spans ({}) VALUES ({})".format(
+            ", ".join(_SPAN_COLUMNS), ", ".join("?" * len(_SPAN_COLUMNS))
+        )
+        session.connection().exec_driver_sql(statement, list(zip(*columns)))
+
     def update_trace_embedding(self, trace_id: str, text_to_embed: str) -> None:
         if not trace_id or not text_to_embed:
             return
@@ -363,6 +611,10 @@ class BaseStorageBackend:
 
     def _create_span_from_dict(self, span_data: Dict[str, Any], trace_id: str) -> Span:
         """Create a Span object from a dictionary."""
+        return Span(**self._span_row_from_dict(span_data, trace_id))
+
+    def _span_row_from_dict(self, span_data: Dict[str, Any], trace_id: str) -> Dict[str, Any]:
+        """Build the column values of a span row from a dictionary."""
         span_id = span_data.get("span_id")
         if not span_id:
             raise ValueError("span_id is required in span_data")
@@ -375,15 +627,15 @@ class BaseStorageBackend:
             attributes = dict(attributes)
             attributes.pop("system_prompt", None)
 
-        return Span(
-            span_id=span_id,
-            trace_id=trace_id,
-            parent_id=span_data.get("parent_id"),
-            name=span_data.get("name") or "Unknown",
-            start_time=start_time,
-            end_time=end_time,
-            attributes=attributes,
-        )
+        return {
+            "span_id": span_id,
+            "trace_id": trace_id,
+            "parent_id": span_data.get("parent_id"),
+            "name": span_data.get("name") or "Unknown",
+            "start_time": start_time,
+            "end_time": end_time,
+            "attributes": attributes,
+        }
 
     @staticmethod
     def _has_active_help_request(spans_data: List[Dict[str, Any]]) -> bool:
@@ -538,10 +790,7 @@ class BaseStorageBackend:
         if not timestamp_str:
             return None
 
-        match = re.match(
-            r"^(?P<base>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?P<frac>\.\d+)?(?P<tz>Z|[+-]\d{2}:?\d{2})?$",
-            timestamp_str
-        )
+        match = re.match(ISO_TIMESTAMP_PATTERN, timestamp_str)
         if not match:
             logger.warning("Failed to parse timestamp '%s'", timestamp_str)
             return None
@@ -666,16 +915,10 @@ class BaseStorageBackend:
                 end_time=end_time,
             )
 
-            if not self.is_sqlite:
-                q = q.offset(skip).limit(limit)
-                if include_spans:
-                    q = q.options(selectinload(Trace.spans))
-                return q.all()
-
+            q = q.offset(skip).limit(limit)
             if include_spans:
                 q = q.options(selectinload(Trace.spans))
-            traces = q.all()
-            return traces[skip: skip + limit]
+            return q.all()
         finally:
             session.close()
 
@@ -762,24 +1005,14 @@ class BaseStorageBackend:
         start_time: Optional[datetime],
         end_time: Optional[datetime],
     ):
-        root_span_times = (
-            session.query(
-                Span.trace_id.label("trace_id"),
-                func.min(Span.start_time).label("root_start_time"),
-            )
-            .filter(Span.parent_id.is_(None))
-            .group_by(Span.trace_id)
-            .subquery()
-        )
-
-        event_time = func.coalesce(root_span_times.c.root_start_time, Trace.created_at)
+        event_time = func.coalesce(TraceIndex.start_time, Trace.created_at)
 
         q = (
             session.query(Trace)
-            .outerjoin(root_span_times, root_span_times.c.trace_id == Trace.id)
+            .outerjoin(TraceIndex, TraceIndex.trace_id == Trace.id)
         )
         if query:
-            q = q.filter(Trace.id.ilike(f"%{query}%"))
+            q = q.filter(Trace.id.ilike(f"%{self._escape_like(query)}%", escape="\\"))
         if status:
             q = q.filter(Trace.status == status)
         if start_time:
@@ -804,14 +1037,10 @@ class BaseStorageBackend:
                     q = q.filter(conf_value <= max_confidence)
             return q.order_by(event_time.desc())
 
-        traces = q.all()
         if min_rating is None and error_type is None and min_confidence is None and max_confidence is None:
-            return (
-                session.query(Trace)
-                .outerjoin(root_span_times, root_span_times.c.trace_id == Trace.id)
-                .filter(Trace.id.in_([t.id for t in traces]))
-                .order_by(event_time.desc())
-            )
+            return q.order_by(event_time.desc())
+
+        traces = q.all()
 
         filtered_ids: List[str] = []
         for trace in traces:
@@ -851,11 +1080,16 @@ class BaseStorageBackend:
 
         return (
             session.query(Trace)
-            .outerjoin(root_span_times, root_span_times.c.trace_id == Trace.id)
+            .outerjoin(TraceIndex, TraceIndex.trace_id == Trace.id)
             .filter(Trace.id.in_(filtered_ids))
             .order_by(event_time.desc())
         )
 
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE wildcards so user input matches literally."""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
     def get_traces_by_ids(self, trace_ids: List[str], include_spans: bool = False) -> List[Trace]:
         """Get traces by a list of trace IDs."""        
         session = self.get_session()
@@ -881,6 +1115,84 @@ class BaseStorageBackend:
         finally:
             session.close()
 
+    def get_episode_trace_summaries(self, episode_id: str) -> List[Dict[str, Any]]:
+        """Summarize each trace of an episode (status, duration, span count) without loading spans."""
+        session = self.get_session()
+        try:
+            failed = or_(
+                func.lower(Span.name).like("%error%"),
+                self._span_attribute("tracebrain.span.type") == "tool_error",
+            )
+            try:
+                rows = (
+                    session.query(
+                        Trace.id,
+                        Trace.created_at,
+                        func.count(Span.id),
+                        func.min(Span.start_time),
+                        func.max(Span.end_time),
+                        func.max(case((failed, 1), else_=0)),
+                    )
+                    .outerjoin(Span, Span.trace_id == Trace.id)
+                    .filter(Trace.episode_id == episode_id)
+                    .group_by(Trace.id, Trace.created_at)
+                    .order_by(Trace.created_at.asc())
+                    .all()
+                )
+            except OperationalError:
+                # SQLite builds without the JSON1 functions
+                if not self.is_sqlite:
+                    raise
+                session.rollback()
+                return [
+                    self._summarize_trace_spans(trace)
+                    for trace in self.get_traces_by_episode_id(episode_id)
+                ]
+
+            summaries = []
+            for trace_id, created_at, span_count, first_start, last_end, has_error in rows:
+                duration_ms = 0.0
+                if first_start and last_end:
+                    duration_ms = (last_end - first_start).total_seconds() * 1000
+                summaries.append(
+                    {
+                        "trace_id": trace_id,
+                        "status": "ERROR" if has_error else "OK",
+                        "duration_ms": round(duration_ms, 2),
+                        "span_count": int(span_count),
+                        "created_at": created_at,
+                    }
+                )
+            return summaries
+        finally:
+            session.close()
+
+    @staticmethod
+    def _summarize_trace_spans(trace: Trace) -> Dict[str, Any]:
+        """Python equivalent of the get_episode_trace_summaries aggregate for one loaded trace."""
+        spans = trace.spans or []
+        start_times = [span.start_time for span in spans if span.start_time]
+        end_times = [span.end_time for span in spans if span.end_time]
+        duration_ms = 0.0
+        if start_times and end_times:
+            duration_ms = (max(end_times) - min(start_times)).total_seconds() * 1000
+
+        status = "OK"
+        for span in spans:
+            name = (span.name or "").lower()
+            span_type = (span.attributes or {}).get("tracebrain.span.type")
+            if "error" in name or span_type == "tool_error":
+                status = "ERROR"
+                break
+
+        return {
+            "trace_id": trace.id,
+            "status": status,
+            "duration_ms": round(duration_ms, 2),
+            "span_count": len(spans),
+            "created_at": trace.created_at,
+        }
+
     def execute_read_only_sql(self, query: str, row_limit: int = 100) -> Dict[str, Any]:
         """Execute a read-only SQL query with defense-in-depth controls."""
         try:
@@ -989,6 +1301,41 @@ class BaseStorageBackend:
         finally:
             session.close()
 
+    def is_empty(self) -> bool:
+        """Return True when no traces are stored, without counting every row."""
+        session = self.get_session()
+        try:
+            return session.query(Trace.id).limit(1).first() is None
+        finally:
+            session.close()
+
+    def get_seed_manifest(self) -> Dict[str, Tuple[int, int, str]]:
+        """Return ``{filename: (size, mtime_ns, digest)}`` for already seeded sample files."""
+        session = self.get_session()
+        try:
+            rows = session.query(
+                SeedManifest.filename,
+                SeedManifest.size,
+                SeedManifest.mtime_ns,
+                SeedManifest.digest,
+            ).all()
+            return {filename: (size, mtime_ns, digest) for filename, size, mtime_ns, digest in rows}
+        finally:
+            session.close()
+
+    def record_seed_manifest(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Insert or refresh seed manifest rows keyed by sample file name."""
+        if not entries:
+            return
+        with self.session_scope() as session:
+            for filename, entry in entries.items():
+                session.merge(SeedManifest(filename=filename, seeded_at=datetime.utcnow(), **entry))
+
+    def clear_seed_manifest(self) -> None:
+        """Forget which sample files were seeded."""
+        with self.session_scope() as session:
+            session.query(SeedManifest).delete(synchronize_session=False)
+
     def cleanup_traces(
         self,
         older_than_hours: Optional[int] = None,
@@ -1397,40 +1744,26 @@ class BaseStorageBackend:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get overall statistics about the TraceStore."""
-        from datetime import timedelta
-
         session = self.get_session()
         try:
-            total_traces = session.query(func.count(Trace.id)).scalar() or 0
-            total_spans = session.query(func.count(Span.id)).scalar() or 0
             if self.engine.dialect.name == "postgresql":
                 rating_value = func.jsonb_extract_path_text(
                     cast(Trace.feedback, JSONB),
                     "rating",
                 )
-                traces_with_feedback = (
-                    session.query(func.count(Trace.id))
-                    .filter(Trace.feedback.isnot(None))
-                    .filter(rating_value.isnot(None))
-                    .scalar()
-                    or 0
-                )
+                has_feedback = and_(Trace.feedback.isnot(None), rating_value.isnot(None))
             else:
-                traces_with_feedback = (
-                    session.query(func.count(Trace.id))
-                    .filter(Trace.feedback.isnot(None))
-                    .filter(Trace.feedback != {})
-                    .scalar()
-                    or 0
-                )
-
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            traces_last_24h = (
-                session.query(func.count(Trace.id))
-                .filter(Trace.created_at >= yesterday)
-                .scalar()
-                or 0
-            )
+                has_feedback = and_(Trace.feedback.isnot(None), Trace.feedback != {})
+
+            yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+            # One round trip: trace aggregates plus the span count as a scalar subquery
+            row = session.query(
+                func.count(Trace.id),
+                func.sum(case((has_feedback, 1), else_=0)),
+                func.sum(case((Trace.created_at >= yesterday, 1), else_=0)),
+                select(func.count(Span.id)).scalar_subquery(),
+            ).one()
+            total_traces, traces_with_feedback, traces_last_24h, total_spans = (value or 0 for value in row)
 
             avg_spans = total_spans / total_traces if total_traces > 0 else 0
 
@@ -1444,45 +1777,60 @@ class BaseStorageBackend:
         finally:
             session.close()
 
+    def _span_attribute(self, key: str):
+        """SQL expression reading a top-level span attribute as text."""
+        if self.engine.dialect.name == "postgresql":
+            return func.jsonb_extract_path_text(Span.attributes, key)
+        return func.json_extract(Span.attributes, f'$."{key}"')
+
     def get_tool_usage_stats(self, limit: int = 10) -> Dict[str, Any]:
         """Get tool usage statistics from all traces."""
         session = self.get_session()
         try:
-            if self.engine.dialect.name == "postgresql":
-                span_type = func.jsonb_extract_path_text(Span.attributes, "tracebrain.span.type")
-                tool_name = func.jsonb_extract_path_text(Span.attributes, "tracebrain.tool.name")
+            span_type = self._span_attribute("tracebrain.span.type")
+            tool_name = self._span_attribute("tracebrain.tool.name")
+
+            call_count = func.count()
+            try:
                 rows = (
-                    session.query(tool_name.label("tool"), func.count().label("count"))
+                    session.query(
+                        tool_name.label("tool"),
+                        call_count.label("count"),
+                        func.sum(call_count).over().label("total"),
+                    )
                     .filter(span_type == "tool_execution")
-                    .filter(tool_name.isnot(None))
+                    .filter(tool_name.isnot(None), tool_name != "")
                     .group_by(tool_name)
-                    .order_by(func.count().desc())
+                    .order_by(call_count.desc(), tool_name)
                     .limit(limit)
                     .all()
                 )
-                tools = [{"tool": row.tool, "count": int(row.count)} for row in rows]
-                total_tool_calls = sum(item["count"] for item in tools)
-                return {"tools": tools, "total_tool_calls": total_tool_calls}
-
-            spans = session.query(Span.attributes).all()
-            tool_counts: Dict[str, int] = {}
-            for (attrs,) in spans:
-                attrs = attrs or {}
-                if attrs.get("tracebrain.span.type") != "tool_execution":
-                    continue
-                tool = attrs.get("tracebrain.tool.name")
-                if not tool:
-                    continue
-                tool_counts[tool] = tool_counts.get(tool, 0) + 1
-
-            tools = [
-                {"tool": tool, "count": count}
-                for tool, count in sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-            ]
-            return {"tools": tools, "total_tool_calls": sum(tool_counts.values())}
+            except OperationalError:
+                # SQLite builds without the JSON1 functions
+                if not self.is_sqlite:
+                    raise
+                session.rollback()
+                return self._count_tool_usage(session, limit)
+
+            tools = [{"tool": row.tool, "count": int(row.count)} for row in rows]
+            total_tool_calls = int(rows[0].total) if rows else 0
+            return {"tools": tools, "total_tool_calls": total_tool_calls}
         finally:
             session.close()
 
+    @staticmethod
+    def _count_tool_usage(session: Session, limit: int) -> Dict[str, Any]:
+        """Aggregate tool usage by scanning span attributes in Python."""
+        tool_names = (
+            attrs.get("tracebrain.tool.name")
+            for (attrs,) in session.query(Span.attributes)
+            if attrs and attrs.get("tracebrain.span.type") == "tool_execution"
+        )
+        tool_counts = Counter(tool for tool in tool_names if tool)
+
+        tools = [{"tool": tool, "count": count} for tool, count in tool_counts.most_common(limit)]
+        return {"tools": tools, "total_tool_calls": sum(tool_counts.values())}
+
     def add_history(self, id: str, type: str) -> None:
         """Add an entry for a trace/episode to users history."""
         session = self.get_session()
@@ -1529,7 +1877,7 @@ class BaseStorageBackend:
             q = session.query(History).filter(History.type == type_filter)
             
             if query:
-                q = q.filter(History.id.ilike(f"%{query}%"))
+                q = q.filter(History.id.ilike(f"%{self._escape_like(query)}%", escape="\\"))
             
             total = q.count()
             items = q.order_by(History.last_accessed.desc()).limit(limit).offset(offset).all()
@@ -1571,7 +1919,7 @@ class BaseStorageBackend:
                     func.min(Trace.created_at).label("created_at"),
                 )
                 .filter(Trace.episode_id.isnot(None))
-                .filter(Trace.episode_id.ilike(f"%{query}%") if query else True)
+                .filter(Trace.episode_id.ilike(f"%{self._escape_like(query)}%", escape="\\") if query else True)
                 .group_by(Trace.episode_id)
             )
 
@@ -1586,30 +1934,16 @@ class BaseStorageBackend:
                     .limit(limit)
                     .all()
                 )
-                result = []
-                for episode in episodes:
-                    trace_query = (
-                        session.query(Trace)
-                        .filter(Trace.episode_id == episode.id)
-                        .order_by(Trace.created_at.asc())
-                    )
-                    if include_spans:
-                        trace_query = trace_query.options(selectinload(Trace.spans))
-                    result.append((episode.id, trace_query.all()))
+                episode_ids = [episode.id for episode in episodes]
+                traces_by_episode = self._load_episode_traces(session, episode_ids, include_spans)
+                result = [(episode_id, traces_by_episode[episode_id]) for episode_id in episode_ids]
                 return result, total
 
             episodes = q.order_by(text("created_at desc")).all()
 
-            result = []
-            for episode in episodes:
-                trace_query = (
-                    session.query(Trace)
-                    .filter(Trace.episode_id == episode.id)
-                    .order_by(Trace.created_at.asc())
-                )
-                if include_spans:
-                    trace_query = trace_query.options(selectinload(Trace.spans))
-                result.append((episode.id, trace_query.all()))
+            episode_ids = [episode.id for episode in episodes]
+            traces_by_episode = self._load_episode_traces(session, episode_ids, include_spans)
+            result = [(episode_id, traces_by_episode[episode_id]) for episode_id in episode_ids]
 
             if min_confidence_lt is not None:
                 filtered = []
@@ -1633,6 +1967,27 @@ class BaseStorageBackend:
         finally:
             session.close()
 
+    @staticmethod
+    def _load_episode_traces(
+        session: Session,
+        episode_ids: List[str],
+        include_spans: bool,
+    ) -> Dict[str, List[Trace]]:
+        """Fetch traces for many episodes with one IN-list query per chunk, oldest first."""
+        traces_by_episode: Dict[str, List[Trace]] = {episode_id: [] for episode_id in episode_ids}
+        for offset in range(0, len(episode_ids), _EPISODE_CHUNK):
+            chunk = episode_ids[offset:offset + _EPISODE_CHUNK]
+            trace_query = (
+                session.query(Trace)
+                .filter(Trace.episode_id.in_(chunk))
+                .order_by(Trace.created_at.asc(), Trace.id.asc())
+            )
+            if include_spans:
+                trace_query = trace_query.options(selectinload(Trace.spans))
+            for trace in trace_query:
+                traces_by_episode[trace.episode_id].append(trace)
+        return traces_by_episode
+
     def list_episode_summaries(
         self,
         skip: int = 0,
@@ -1659,7 +2014,7 @@ class BaseStorageBackend:
                     .group_by(Trace.episode_id)
                 )
                 if query:
-                    base_query = base_query.filter(Trace.episode_id.ilike(f"%{query}%"))
+                    base_query = base_query.filter(Trace.episode_id.ilike(f"%{self._escape_like(query)}%", escape="\\"))
                 if min_confidence_lt is not None:
                     base_query = base_query.having(func.min(conf_value) < min_confidence_lt)
 
@@ -1687,7 +2042,7 @@ class BaseStorageBackend:
 
             traces_query = session.query(Trace).filter(Trace.episode_id.isnot(None))
             if query:
-                traces_query = traces_query.filter(Trace.episode_id.ilike(f"%{query}%"))
+                traces_query = traces_query.filter(Trace.episode_id.ilike(f"%{self._escape_like(query)}%", escape="\\"))
             traces = traces_query.all()
 
             episodes_map: Dict[str, Dict[str, Any]] = {}
@@ -8,7 +8,8 @@ conforming to the TraceBrain Standard OTLP Trace Schema.
 from datetime import datetime
 from enum import Enum
 from sqlalchemy import (
-    Column, String, Integer, DateTime, ForeignKey, Index, Text, UniqueConstraint, Enum as SAEnum
+    BigInteger, Column, String, Integer, DateTime, ForeignKey, Index, Text, UniqueConstraint, Enum as SAEnum,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
@@ -216,6 +217,14 @@ class Span(Base):
         UniqueConstraint("trace_id", "span_id", name="uq_span_trace_spanid"),
         Index("idx_span_trace_parent", "trace_id", "parent_id"),
         Index("idx_span_trace_time", "trace_id", "start_time"),
+        # Root spans drive trace ordering and time filters in list views
+        Index(
+            "idx_span_root_time",
+            "trace_id",
+            "start_time",
+            sqlite_where=text("parent_id IS NULL"),
+            postgresql_where=text("parent_id IS NULL"),
+        ),
         Index("idx_span_attributes_gin", "attributes", postgresql_using="gin"),
     )
     
@@ -223,6 +232,29 @@ class Span(Base):
         return f"<Span(span_id='{self.span_id}', name='{self.name}', trace_id='{self.trace_id}')>"
 
 
+class TraceIndex(Base):
+    """
+    Per-trace time bounds derived from its spans.
+
+    One row per trace that has spans, kept in step with span writes so trace
+    lists can be ordered and filtered by time without aggregating spans.
+    """
+    __tablename__ = "trace_index"
+
+    trace_id = Column(
+        String,
+        ForeignKey("traces.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to the trace",
+    )
+    start_time = Column(DateTime(timezone=True), nullable=True, comment="Earliest root span start")
+    end_time = Column(DateTime(timezone=True), nullable=True, comment="Latest span end")
+
+    __table_args__ = (
+        Index("idx_trace_index_time", "start_time", "end_time"),
+    )
+
+
 class ChatSession(Base):
     """Represents a chat session for conversational memory."""
 
@@ -291,6 +323,24 @@ class History(Base):
     )
 
 
+class SeedManifest(Base):
+    """Sample files already loaded by the seeder, keyed by file name."""
+
+    __tablename__ = "seed_manifest"
+
+    filename = Column(String, primary_key=True, comment="Sample file name")
+    size = Column(BigInteger, nullable=False, comment="File size in bytes")
+    mtime_ns = Column(BigInteger, nullable=False, comment="File modification time in nanoseconds")
+    digest = Column(String(64), nullable=False, comment="BLAKE2b digest prefix of the file content")
+    trace_id = Column(String, nullable=True, comment="Trace ID loaded from the file")
+    seeded_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="Timestamp when the file was seeded",
+    )
+
+
 class AppSettings(Base):
     """Singleton application settings storage (global config)."""
 
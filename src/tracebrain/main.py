@@ -20,6 +20,7 @@ import os
 import logging
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
+import zlib
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -27,6 +28,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
 
+try:
+    import zstandard
+except ImportError:  # optional, installed with the ``fast`` extra
+    zstandard = None
+
 from .config import settings
 from .api.v1.api_router import router as api_v1_router
 
@@ -159,6 +165,119 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
         content={"detail": "Internal server error"}
     )
 
+# ============================================================================
+# Request Body Decompression
+# ============================================================================
+# SDK clients compress large trace payloads once the server advertises support
+# via the Accept-Encoding response header (RFC 7694).
+_MAX_DECOMPRESSED_BODY = 64 * 1024 * 1024
+_ACCEPTED_REQUEST_ENCODINGS = ("zstd", "gzip") if zstandard else ("gzip",)
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+def _decompress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decoded = decoder.decompress(body, _MAX_DECOMPRESSED_BODY + 1)
+        if len(decoded) > _MAX_DECOMPRESSED_BODY or decoder.unconsumed_tail:
+            raise _BodyTooLarge()
+        return decoded
+    with zstandard.ZstdDecompressor().stream_reader(body) as reader:
+        decoded = reader.read(_MAX_DECOMPRESSED_BODY + 1)
+    if len(decoded) > _MAX_DECOMPRESSED_BODY:
+        raise _BodyTooLarge()
+    return decoded
+
+
+class RequestDecompressionMiddleware:
+    """Decode gzip/zstd request bodies and advertise them in Accept-Encoding."""
+
+    def __init__(self, app):
+        self.app = app
+        self.accept_encoding = ", ".join(_ACCEPTED_REQUEST_ENCODINGS).encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_accept_encoding(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"accept-encoding", self.accept_encoding))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        encoding = None
+        for name, value in scope["headers"]:
+            if name == b"content-encoding":
+                encoding = value.decode("latin-1").strip().lower()
+                break
+
+        if not encoding or encoding == "identity":
+            await self.app(scope, receive, send_with_accept_encoding)
+            return
+
+        if encoding not in _ACCEPTED_REQUEST_ENCODINGS:
+            response = JSONResponse(
+                status_code=415,
+                content={"detail": f"Unsupported Content-Encoding: {encoding}"},
+            )
+            await response(scope, receive, send_with_accept_encoding)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        try:
+            body = _decompress_body(b"".join(chunks), encoding)
+        except _BodyTooLarge:
+            response = JSONResponse(
+                status_code=413,
+                content={"detail": "Decompressed request body is too large"},
+            )
+            await response(scope, receive, send_with_accept_encoding)
+            return
+        except Exception:
+            logger.warning("Failed to decode %s request body", encoding)
+            response = JSONResponse(
+                status_code=400,
+                content={"detail": f"Malformed {encoding} request body"},
+            )
+            await response(scope, receive, send_with_accept_encoding)
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        scope = {**scope, "headers": headers}
+
+        body_sent = False
+
+        async def receive_decoded():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decoded, send_with_accept_encoding)
+
+
+app.add_middleware(RequestDecompressionMiddleware)
+
 # ============================================================================
 # CORS Middleware Configuration
 # ============================================================================
@@ -4,10 +4,15 @@ TraceBrain SDK
 This module provides client-side tools for interacting with the TraceBrain API.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .client import TraceClient
-from tracebrain.core.llm_providers import extract_usage_from_response, select_provider, ProviderError
 from .agent_tools import search_past_experiences, search_similar_traces, request_human_intervention
 
+if TYPE_CHECKING:
+	from tracebrain.core.llm_providers import extract_usage_from_response, select_provider, ProviderError
+
 __all__ = [
 	"TraceClient",
 	"extract_usage_from_response",
@@ -17,3 +22,20 @@ __all__ = [
 	"search_similar_traces",
 	"request_human_intervention",
 ]
+
+# Provider helpers pull in settings and the provider registry; agent processes
+# that only log traces should not pay for that at import time.
+_LAZY_ATTRS = {
+	"extract_usage_from_response": "tracebrain.core.llm_providers",
+	"select_provider": "tracebrain.core.llm_providers",
+	"ProviderError": "tracebrain.core.llm_providers",
+}
+
+
+def __getattr__(name: str):
+	module_name = _LAZY_ATTRS.get(name)
+	if module_name is None:
+		raise AttributeError(f"module 'tracebrain.sdk' has no attribute '{name}'")
+	value = getattr(import_module(module_name), name)
+	globals()[name] = value
+	return value
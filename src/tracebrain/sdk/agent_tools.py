@@ -5,6 +5,7 @@ Agent tool wrappers for TraceBrain TraceStore.
 from __future__ import annotations
 
 import os
+import threading
 from typing import Any, Dict, Optional
 import requests
 
@@ -19,6 +20,19 @@ def tool(func):
 
 API_BASE_URL = os.getenv("TRACEBRAIN_API_BASE_URL", "http://localhost:8000/api/v1")
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session used by all agent tools."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = requests.Session()
+    return _session
+
 
 class ActiveHelpRequest(RuntimeError):
     """Raised when an agent explicitly requests human intervention."""
@@ -33,7 +47,7 @@ def _init_trace_if_missing(trace_id: str) -> None:
     if not trace_id:
         return
     try:
-        requests.post(
+        _get_session().post(
             f"{API_BASE_URL}/traces/init",
             json={"trace_id": trace_id},
             timeout=5,
@@ -45,7 +59,7 @@ def _init_trace_if_missing(trace_id: str) -> None:
 @tool
 def search_past_experiences(task_description: str, min_rating: int = 4, limit: int = 3) -> Dict[str, Any]:
     """Find similar high-quality traces for in-context learning."""
-    response = requests.get(
+    response = _get_session().get(
         f"{API_BASE_URL}/traces/search",
         params={"text": task_description, "min_rating": min_rating, "limit": limit},
         timeout=10,
@@ -57,7 +71,7 @@ def search_past_experiences(task_description: str, min_rating: int = 4, limit: i
 @tool
 def search_similar_traces(query: str, min_rating: int = 4, limit: int = 3) -> Dict[str, Any]:
     """Find traces with semantically similar content."""
-    response = requests.get(
+    response = _get_session().get(
         f"{API_BASE_URL}/traces/search",
         params={"text": query, "min_rating": min_rating, "limit": limit},
         timeout=10,
@@ -77,14 +91,14 @@ def request_human_intervention(reason: str) -> Dict[str, Any]:
             "reason": reason,
         }
 
-    response = requests.post(
+    response = _get_session().post(
         f"{API_BASE_URL}/traces/{trace_id}/signal",
         json={"reason": reason},
         timeout=10,
     )
     if response.status_code == 404:
         _init_trace_if_missing(trace_id)
-        response = requests.post(
+        response = _get_session().post(
             f"{API_BASE_URL}/traces/{trace_id}/signal",
             json={"reason": reason},
             timeout=10,
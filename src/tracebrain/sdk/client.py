@@ -23,10 +23,15 @@ Usage:
         print("TraceStore is reachable")
 """
 
+import gzip
 import logging
 import json
+import queue
+import random
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Dict, Any, Optional, List, Iterator
 from urllib.parse import urljoin
 
@@ -34,12 +39,158 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from tracebrain.core.schema import TraceBrainAttributes, SpanType
+from tracebrain.core.schema import (
+    EPISODE_ID,
+    LLM_COMPLETION,
+    LLM_INFERENCE,
+    LLM_NEW_CONTENT,
+    LLM_THOUGHT,
+    LLM_TOOL_CODE,
+    MAX_TRACE_BATCH_SIZE,
+    SPAN_TYPE,
+    SYSTEM_PROMPT,
+    TOOL_EXECUTION,
+    TOOL_INPUT,
+    TOOL_NAME,
+    TOOL_OUTPUT,
+    USAGE,
+    Trace as TraceSchema,
+    get_iso_time_now,
+)
 from tracebrain.sdk.agent_tools import ActiveHelpRequest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional speedup
+    zstandard = None
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Attribute keys are often TraceBrainAttributes members, which orjson only accepts
+# as dict keys with OPT_NON_STR_KEYS.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC if orjson else 0
+)
+
+
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Request body encodings this client can produce, in order of preference
+_REQUEST_ENCODINGS = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when a request is short-circuited because the API is marked unavailable."""
+
+
+class _CircuitBreaker:
+    """
+    Minimal CLOSED -> OPEN -> HALF_OPEN circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once ``recovery_timeout`` seconds have passed a single
+    probe request is let through; its outcome closes or re-opens the circuit.
+    A probe that never reports back is given up on after another
+    ``recovery_timeout`` and a new probe is let through.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            # _opened_at is also the probe start while HALF_OPEN
+            if now - self._opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_circuit_breakers: Dict[str, _CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def _get_circuit_breaker(base_url: str, failure_threshold: int, recovery_timeout: float) -> _CircuitBreaker:
+    """Return the circuit breaker shared by all clients talking to ``base_url``."""
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(base_url)
+        if breaker is None:
+            breaker = _CircuitBreaker(failure_threshold, recovery_timeout)
+            _circuit_breakers[base_url] = breaker
+        return breaker
+
+
+class _IdempotentRetry(Retry):
+    """
+    urllib3 retry policy that never retries methods outside ``allowed_methods``.
+
+    urllib3 only consults ``allowed_methods`` for read and status retries and
+    retries connect errors for every method. POSTs are retried by
+    ``TraceClient._post``, so they must fail through on the first error here.
+    """
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        if method is not None and not self._is_method_retryable(method):
+            # Let a zero-budget copy raise the usual MaxRetryError
+            return Retry.increment(self.new(total=0), method, url, *args, **kwargs)
+        return super().increment(method, url, *args, **kwargs)
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a payload to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# Constant parts of the spans TraceScope appends on exit; copied and patched per trace
+_HELP_SPAN_TEMPLATE: Dict[str, Any] = {"parent_id": None, "name": "Active Help Request"}
+_HELP_SPAN_ATTRIBUTES: Dict[str, Any] = {
+    SPAN_TYPE: TOOL_EXECUTION,
+    TOOL_NAME: "request_human_intervention",
+}
+_CRASH_SPAN_TEMPLATE: Dict[str, Any] = {"parent_id": None, "name": "Agent Crash"}
+_CRASH_SPAN_ATTRIBUTES: Dict[str, Any] = {"otel.status_code": "ERROR"}
+
 
 class TraceClient:
     """
@@ -47,7 +198,9 @@ class TraceClient:
     
     Features:
     - Connection pooling via requests.Session
-    - Automatic retries on network errors and 5xx status codes
+    - Automatic retries with jittered backoff on network errors, 429 and 5xx
+    - Per-API circuit breaker so an unavailable backend fails fast
+    - Optional background batching via log_trace_async()
     - Fail-safe design: errors are logged but don't crash the application
     - Optional API key authentication
     
@@ -63,7 +216,19 @@ class TraceClient:
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        retry_on_post: bool = True
+        retry_on_post: bool = True,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        breaker_threshold: int = 5,
+        breaker_recovery: float = 30.0,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        compress: bool = True,
+        compress_min_bytes: int = 1024,
+        strict: bool = False,
     ):
         """
         Initialize the TraceClient with retry strategy and session pooling.
@@ -73,6 +238,21 @@ class TraceClient:
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retry attempts (default: 3)
+            retry_on_post: Retry POST requests on transient failures (default: True)
+            backoff_base: Base delay in seconds for exponential backoff (default: 0.5)
+            backoff_cap: Upper bound in seconds for a single backoff delay (default: 8.0)
+            breaker_threshold: Consecutive failures before the circuit opens (default: 5)
+            breaker_recovery: Seconds the circuit stays open before a probe (default: 30.0)
+            batch_size: Maximum traces per batch sent by log_trace_async, capped at
+                MAX_TRACE_BATCH_SIZE (default: 500)
+            flush_interval: Seconds to wait before flushing a partial batch (default: 1.0)
+            max_queue_size: Maximum traces buffered by log_trace_async (default: 10000)
+            pool_connections: Number of per-host connection pools to cache (default: 10)
+            pool_maxsize: Keep-alive connections kept per host (default: 20)
+            compress: Compress POST bodies once the server advertises support (default: True)
+            compress_min_bytes: Smallest body worth compressing, in bytes (default: 1024)
+            strict: Validate every trace against the schema before sending; useful
+                    during development (default: False)
         
         Example:
             client = TraceClient(
@@ -85,22 +265,43 @@ class TraceClient:
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_on_post = retry_on_post
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.strict = strict
+        self._breaker = _get_circuit_breaker(self.base_url, breaker_threshold, breaker_recovery)
+
+        # Request compression is only used after the server lists a supported
+        # encoding in an Accept-Encoding response header (RFC 7694).
+        self.compress = compress
+        self.compress_min_bytes = compress_min_bytes
+        self._request_encoding: Optional[str] = None
+
+        # Background batching state; the flush thread starts on first use
+        self.batch_size = min(max(1, batch_size), MAX_TRACE_BATCH_SIZE)
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
         
         # Initialize requests session for connection pooling
         self.session = requests.Session()
         
-        # Configure retry strategy
+        # Configure retry strategy for idempotent methods
         # Retry on:
         # - Connection errors (network issues)
         # - 500, 502, 503, 504 (server errors)
         # - 429 (rate limiting - with backoff)
+        # POST requests are retried only by _post() so they can use jittered
+        # backoff and report to the circuit breaker; _IdempotentRetry keeps
+        # urllib3 from retrying their connect errors as well.
         allowed_methods = ["HEAD", "GET", "PUT", "DELETE", "OPTIONS"]
-        if retry_on_post:
-            allowed_methods.append("POST")
 
-        retry_strategy = Retry(
+        retry_strategy = _IdempotentRetry(
             total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=sorted(_RETRY_STATUS_CODES),
             allowed_methods=frozenset(allowed_methods),
             backoff_factor=1,  # Wait 1s, 2s, 4s between retries
             raise_on_status=False,  # Don't raise exceptions, we handle them manually
@@ -110,8 +311,8 @@ class TraceClient:
         # Mount retry adapter for both HTTP and HTTPS
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
@@ -143,9 +344,108 @@ class TraceClient:
         """
         return urljoin(self.base_url + '/', path.lstrip('/'))
 
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header."""
+        delay_cap = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(self.backoff_cap, float(retry_after))
+        return random.uniform(0, delay_cap)
+
+    def _negotiate_encoding(self, response: requests.Response) -> None:
+        """Pick a request body encoding from the server's Accept-Encoding header."""
+        if not self.compress or self._request_encoding is not None:
+            return
+        advertised = response.headers.get("Accept-Encoding")
+        if not advertised:
+            return
+        offered = {token.split(";")[0].strip().lower() for token in advertised.split(",")}
+        for encoding in _REQUEST_ENCODINGS:
+            if encoding in offered:
+                self._request_encoding = encoding
+                logger.debug(f"Compressing request bodies with {encoding}")
+                return
+
+    def _post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        POST a pre-encoded body, retrying transient failures.
+
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        full-jitter backoff. Other 4xx responses are returned immediately.
+        Bodies of at least ``compress_min_bytes`` are compressed once an
+        encoding has been negotiated with the server.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker for this API is open.
+            requests.exceptions.RequestException: If the final attempt fails.
+        """
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self.base_url}; skipping request")
+
+        body = data
+        request_headers = dict(headers or {})
+        encoding = self._request_encoding
+        if self.compress and encoding and len(data) >= self.compress_min_bytes:
+            body = _compress(data, encoding)
+            request_headers["Content-Encoding"] = encoding
+
+        attempts = self.max_retries + 1 if self.retry_on_post else 1
+        attempt = 0
+        succeeded = False
+        try:
+            while True:
+                response = None
+                try:
+                    response = self.session.post(
+                        url,
+                        data=body,
+                        timeout=self.timeout,
+                        headers=request_headers or None,
+                    )
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if attempt + 1 >= attempts:
+                        raise
+                else:
+                    self._negotiate_encoding(response)
+                    if response.status_code == 415 and "Content-Encoding" in request_headers:
+                        # The server no longer accepts this encoding; resend uncompressed.
+                        logger.info(
+                            f"Server rejected {request_headers.pop('Content-Encoding')} request bodies; "
+                            f"disabling compression"
+                        )
+                        self.compress = False
+                        body = data
+                        continue
+                    if response.status_code not in _RETRY_STATUS_CODES:
+                        succeeded = True
+                        return response
+                    if attempt + 1 >= attempts:
+                        return response
+                time.sleep(self._backoff_delay(attempt, response))
+                attempt += 1
+        finally:
+            # Every exit resolves the breaker, including unexpected errors, so a
+            # HALF_OPEN probe can never leave the circuit stuck.
+            if succeeded:
+                self._breaker.record_success()
+            else:
+                self._breaker.record_failure()
+
     @staticmethod
-    def _iso_now() -> str:
-        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    def _is_valid_trace(trace_data: Dict[str, Any]) -> bool:
+        """Validate a trace against the schema, logging why it was rejected."""
+        try:
+            TraceSchema.model_validate(trace_data)
+            return True
+        except ValueError as e:
+            logger.warning(f"Invalid trace {trace_data.get('trace_id', 'unknown')} not sent: {e}")
+            return False
 
     @staticmethod
     def _ensure_trace_id(trace_data: Dict[str, Any]) -> None:
@@ -185,17 +485,22 @@ class TraceClient:
     def trace_scope(self, system_prompt: str, episode_id: Optional[str] = None) -> "TraceScope":
         return TraceScope(self, episode_id=episode_id, system_prompt=system_prompt)
     
-    def log_trace(self, trace_data: Dict[str, Any]) -> bool:
+    def log_trace(self, trace_data: Dict[str, Any], validate: Optional[bool] = None) -> bool:
         """
         Send a trace to the TraceStore API.
         
         This method implements a fail-safe design: if the trace cannot be sent,
         it logs the error but returns False instead of raising an exception.
         This ensures that observability failures don't crash the main application.
+
+        The server validates every trace on ingest and is the source of truth,
+        so the client serializes the dict as-is unless validation is requested.
         
         Args:
             trace_data: Dictionary containing the trace data conforming to
                        TraceBrain Standard OTLP Trace Schema
+            validate: Check the trace against the schema before sending.
+                      Defaults to the client's ``strict`` setting.
         
         Returns:
             bool: True if trace was successfully logged, False otherwise
@@ -229,18 +534,16 @@ class TraceClient:
         self._ensure_trace_id(trace_data)
         self._mark_failed_if_error(trace_data)
         url = self._make_url("/api/v1/traces")
+
+        if (self.strict if validate is None else validate) and not self._is_valid_trace(trace_data):
+            return False
         
         try:
             headers = {}
             if trace_data.get("trace_id"):
                 headers["Idempotency-Key"] = trace_data["trace_id"]
 
-            response = self.session.post(
-                url,
-                json=trace_data,
-                timeout=self.timeout,
-                headers=headers or None
-            )
+            response = self._post(url, _dumps(trace_data), headers=headers or None)
             
             # Check if request was successful
             if response.status_code in (200, 201):
@@ -257,6 +560,13 @@ class TraceClient:
                 )
                 return False
                 
+        except CircuitOpenError:
+            logger.warning(
+                f"TraceStore at {self.base_url} is marked unavailable; "
+                f"dropping trace {trace_data.get('trace_id', 'unknown')}"
+            )
+            return False
+
         except requests.exceptions.Timeout:
             logger.error(
                 f"Timeout while logging trace to {url}. "
@@ -264,6 +574,148 @@ class TraceClient:
             )
             return False
 
+        except requests.exceptions.ConnectionError as e:
+            logger.error(
+                f"Connection error while logging trace to {url}. "
+                f"Is the TraceStore running? Error: {str(e)}"
+            )
+            return False
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(
+                f"Unexpected error while logging trace: {str(e)}"
+            )
+            return False
+            
+        except Exception as e:
+            # Catch-all for any other errors (JSON serialization, etc.)
+            logger.error(
+                f"Critical error in log_trace: {type(e).__name__}: {str(e)}",
+                exc_info=True
+            )
+            return False
+
+    def log_trace_async(self, trace_data: Dict[str, Any]) -> bool:
+        """
+        Queue a trace to be sent in a background batch.
+
+        Traces are flushed to the batch ingest endpoint once ``batch_size``
+        traces are buffered, every ``flush_interval`` seconds, or on
+        ``flush()``/``close()``. Delivery is best-effort: if the buffer is full
+        the trace is dropped and False is returned.
+
+        Args:
+            trace_data: Dictionary containing the trace data conforming to
+                       TraceBrain Standard OTLP Trace Schema
+
+        Returns:
+            bool: True if the trace was queued, False otherwise
+        """
+        self._ensure_trace_id(trace_data)
+        self._mark_failed_if_error(trace_data)
+        if self.strict and not self._is_valid_trace(trace_data):
+            return False
+        self._ensure_flush_thread()
+
+        try:
+            self._queue.put_nowait(trace_data)
+            return True
+        except queue.Full:
+            logger.warning(
+                f"Trace buffer is full; dropping trace {trace_data.get('trace_id', 'unknown')}"
+            )
+            return False
+
+    def flush(self) -> None:
+        """Send every trace queued by log_trace_async in the calling thread."""
+        while True:
+            batch: List[Dict[str, Any]] = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._send_batch(batch)
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        with self._flush_thread_lock:
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                name="tracebrain-flush",
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop_event.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._send_batch(batch)
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Wait up to flush_interval for queued traces, returning at most batch_size."""
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        """POST a batch of traces, falling back to single ingest on older servers."""
+        url = self._make_url("/api/v1/traces/batch")
+        try:
+            response = self._post(url, _dumps({"traces": batch}))
+            if response.status_code in (200, 201):
+                failed_ids = self._failed_batch_ids(response)
+                if failed_ids:
+                    logger.warning(
+                        f"TraceStore did not store {len(failed_ids)} of {len(batch)} batched traces: "
+                        f"{', '.join(failed_ids)}"
+                    )
+                    return False
+                logger.debug(f"Logged batch of {len(batch)} traces")
+                return True
+            # 404/405: older server without the batch endpoint. 422: one invalid trace
+            # rejects the whole request, so send them singly to keep the valid ones.
+            if response.status_code in (404, 405, 422):
+                return all([self.log_trace(trace_data) for trace_data in batch])
+            logger.warning(
+                f"Failed to log trace batch of {len(batch)}. Status: {response.status_code}, "
+                f"Response: {response.text[:200]}"
+            )
+            return False
+        except CircuitOpenError:
+            logger.warning(
+                f"TraceStore at {self.base_url} is marked unavailable; "
+                f"dropping batch of {len(batch)} traces"
+            )
+            return False
+        except Exception as e:
+            logger.error(f"Error while logging trace batch of {len(batch)}: {str(e)}")
+            return False
+
+    @staticmethod
+    def _failed_batch_ids(response: requests.Response) -> List[str]:
+        try:
+            body = response.json()
+        except ValueError:
+            return []
+        failed = body.get("failed_trace_ids") if isinstance(body, dict) else None
+        return [str(trace_id) for trace_id in failed] if isinstance(failed, list) else []
+
     def init_trace(
         self,
         trace_id: Optional[str] = None,
@@ -279,7 +731,7 @@ class TraceClient:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response = self._post(url, _dumps(payload))
             if response.status_code in (200, 201):
                 return payload["trace_id"]
             logger.warning(
@@ -291,27 +743,6 @@ class TraceClient:
         except requests.exceptions.RequestException as e:
             logger.error("Error initializing trace: %s", str(e))
             return None
-            
-        except requests.exceptions.ConnectionError as e:
-            logger.error(
-                f"Connection error while logging trace to {url}. "
-                f"Is the TraceStore running? Error: {str(e)}"
-            )
-            return False
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                f"Unexpected error while logging trace: {str(e)}"
-            )
-            return False
-            
-        except Exception as e:
-            # Catch-all for any other errors (JSON serialization, etc.)
-            logger.error(
-                f"Critical error in log_trace: {type(e).__name__}: {str(e)}",
-                exc_info=True
-            )
-            return False
     
     def health_check(self) -> bool:
         """
@@ -345,6 +776,7 @@ class TraceClient:
                 response = self.session.get(url, timeout=5)
                 
                 if response.status_code == 200:
+                    self._negotiate_encoding(response)
                     logger.info(f"TraceStore is healthy at {self.base_url}")
                     return True
                     
@@ -463,11 +895,7 @@ class TraceClient:
             feedback_data["metadata"] = metadata
         
         try:
-            response = self.session.post(
-                url,
-                json=feedback_data,
-                timeout=self.timeout
-            )
+            response = self._post(url, _dumps(feedback_data))
             
             if response.status_code == 200:
                 logger.info(f"Feedback added to trace {trace_id}")
@@ -507,6 +935,7 @@ class TraceClient:
         Close the HTTP session and release resources.
         
         Call this when you're done using the client to clean up connections.
+        Traces still queued by log_trace_async are flushed first.
         
         Example:
             client = TraceClient()
@@ -515,6 +944,11 @@ class TraceClient:
             finally:
                 client.close()
         """
+        self._stop_event.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=self.flush_interval + self.timeout)
+            self._flush_thread = None
+        self.flush()
         self.session.close()
         logger.info("TraceClient session closed")
     
@@ -543,8 +977,8 @@ class TraceScope:
         self._trace_data: Dict[str, Any] = {
             "trace_id": uuid.uuid4().hex,
             "attributes": {
-                TraceBrainAttributes.SYSTEM_PROMPT: system_prompt,
-                TraceBrainAttributes.EPISODE_ID: episode_id,
+                SYSTEM_PROMPT: system_prompt,
+                EPISODE_ID: episode_id,
             },
             "spans": [],
         }
@@ -553,8 +987,8 @@ class TraceScope:
         trace_id = self._trace_data.get("trace_id")
         initialized_id = self._client.init_trace(
             trace_id=trace_id,
-            episode_id=self._trace_data["attributes"].get(TraceBrainAttributes.EPISODE_ID),
-            system_prompt=self._trace_data["attributes"].get(TraceBrainAttributes.SYSTEM_PROMPT),
+            episode_id=self._trace_data["attributes"].get(EPISODE_ID),
+            system_prompt=self._trace_data["attributes"].get(SYSTEM_PROMPT),
         )
         if initialized_id:
             self._trace_data["trace_id"] = initialized_id
@@ -573,19 +1007,17 @@ class TraceScope:
         if exc_type is not None and issubclass(exc_type, ActiveHelpRequest):
             reason = getattr(exc_val, "reason", None) or "Active help requested"
             response = getattr(exc_val, "response", None) or {"reason": reason}
-            help_span = {
-                "span_id": uuid.uuid4().hex[:16],
-                "parent_id": None,
-                "name": "Active Help Request",
-                "start_time": TraceClient._iso_now(),
-                "end_time": TraceClient._iso_now(),
-                "attributes": {
-                    TraceBrainAttributes.SPAN_TYPE: SpanType.TOOL_EXECUTION,
-                    TraceBrainAttributes.TOOL_NAME: "request_human_intervention",
-                    TraceBrainAttributes.TOOL_INPUT: reason,
-                    TraceBrainAttributes.TOOL_OUTPUT: response,
-                },
-            }
+            now = get_iso_time_now()
+            help_attributes = dict(_HELP_SPAN_ATTRIBUTES)
+            help_attributes[TOOL_INPUT] = reason
+            help_attributes[TOOL_OUTPUT] = response
+            help_span = dict(
+                _HELP_SPAN_TEMPLATE,
+                span_id=uuid.uuid4().hex[:16],
+                start_time=now,
+                end_time=now,
+                attributes=help_attributes,
+            )
             self._trace_data.setdefault("spans", []).append(help_span)
             self._client.log_trace(self._trace_data)
             from .trace_context import reset_trace_id
@@ -594,17 +1026,16 @@ class TraceScope:
             return True
 
         message = str(exc_val) if exc_val else "Unhandled exception"
-        crash_span = {
-            "span_id": uuid.uuid4().hex[:16],
-            "parent_id": None,
-            "name": "Agent Crash",
-            "start_time": TraceClient._iso_now(),
-            "end_time": TraceClient._iso_now(),
-            "attributes": {
-                "otel.status_code": "ERROR",
-                "otel.status_description": message,
-            },
-        }
+        now = get_iso_time_now()
+        crash_attributes = dict(_CRASH_SPAN_ATTRIBUTES)
+        crash_attributes["otel.status_description"] = message
+        crash_span = dict(
+            _CRASH_SPAN_TEMPLATE,
+            span_id=uuid.uuid4().hex[:16],
+            start_time=now,
+            end_time=now,
+            attributes=crash_attributes,
+        )
         self._trace_data.setdefault("spans", []).append(crash_span)
         TraceClient._mark_failed_if_error(self._trace_data)
         self._client.log_trace(self._trace_data)
@@ -627,7 +1058,7 @@ class TraceScope:
         provider_name = provider or settings.LLM_PROVIDER
         usage = extract_usage_from_response(provider_name, response)
         if usage:
-            attrs[TraceBrainAttributes.USAGE] = usage
+            attrs[USAGE] = usage
         return usage
 
     @staticmethod
@@ -670,17 +1101,17 @@ class TraceScope:
         """Reconstruct ChatML messages from a raw OTLP trace."""
         messages: List[Dict[str, str]] = []
         attributes = trace_data.get("attributes") or {}
-        system_prompt = attributes.get(TraceBrainAttributes.SYSTEM_PROMPT) or attributes.get("system_prompt")
+        system_prompt = attributes.get(SYSTEM_PROMPT) or attributes.get("system_prompt")
         if system_prompt:
             messages.append({"role": "system", "content": str(system_prompt)})
 
         path, target_span = TraceScope._build_llm_inference_path(trace_data)
         for span in path:
             attrs = span.get("attributes") or {}
-            new_content = attrs.get(TraceBrainAttributes.LLM_NEW_CONTENT)
+            new_content = attrs.get(LLM_NEW_CONTENT)
             messages.extend(TraceScope._normalize_messages(new_content))
             if span is not target_span:
-                completion = attrs.get(TraceBrainAttributes.LLM_COMPLETION)
+                completion = attrs.get(LLM_COMPLETION)
                 if completion:
                     messages.append({"role": "assistant", "content": str(completion)})
 
@@ -693,7 +1124,7 @@ class TraceScope:
         messages: List[Dict[str, str]] = []
 
         attributes = trace_data.get("attributes") or {}
-        system_prompt = attributes.get(TraceBrainAttributes.SYSTEM_PROMPT) or attributes.get("system_prompt")
+        system_prompt = attributes.get(SYSTEM_PROMPT) or attributes.get("system_prompt")
         if system_prompt:
             messages.append({"role": "system", "content": str(system_prompt)})
 
@@ -701,27 +1132,27 @@ class TraceScope:
         tool_outputs: Dict[str, Any] = {}
         for span in spans:
             attrs = span.get("attributes") or {}
-            if attrs.get(TraceBrainAttributes.SPAN_TYPE) != SpanType.TOOL_EXECUTION:
+            if attrs.get(SPAN_TYPE) != TOOL_EXECUTION:
                 continue
             parent_id = span.get("parent_id")
             if parent_id and parent_id not in tool_outputs:
-                tool_outputs[parent_id] = attrs.get(TraceBrainAttributes.TOOL_OUTPUT)
+                tool_outputs[parent_id] = attrs.get(TOOL_OUTPUT)
 
         path, target_span = TraceScope._build_llm_inference_path(trace_data)
         for span in path:
             attrs = span.get("attributes") or {}
 
-            new_content = attrs.get(TraceBrainAttributes.LLM_NEW_CONTENT)
+            new_content = attrs.get(LLM_NEW_CONTENT)
             new_messages = TraceScope._normalize_messages(new_content)
             if new_messages:
                 messages.extend(new_messages)
 
-            completion = attrs.get(TraceBrainAttributes.LLM_COMPLETION)
+            completion = attrs.get(LLM_COMPLETION)
             turn = {
                 "prompt_for_model": [dict(item) for item in messages],
                 "model_completion": completion,
-                "thought": attrs.get(TraceBrainAttributes.LLM_THOUGHT),
-                "tool_code": attrs.get(TraceBrainAttributes.LLM_TOOL_CODE),
+                "thought": attrs.get(LLM_THOUGHT),
+                "tool_code": attrs.get(LLM_TOOL_CODE),
                 "tool_output": tool_outputs.get(span.get("span_id")),
             }
             turns.append(turn)
@@ -743,7 +1174,7 @@ class TraceScope:
             if span_id:
                 span_map[span_id] = span
             attrs = span.get("attributes") or {}
-            if attrs.get(TraceBrainAttributes.SPAN_TYPE) == SpanType.LLM_INFERENCE:
+            if attrs.get(SPAN_TYPE) == LLM_INFERENCE:
                 llm_spans.append(span)
 
         if not llm_spans:
@@ -758,7 +1189,7 @@ class TraceScope:
         current = target_span
         while current is not None:
             attrs = current.get("attributes") or {}
-            if attrs.get(TraceBrainAttributes.SPAN_TYPE) == SpanType.LLM_INFERENCE:
+            if attrs.get(SPAN_TYPE) == LLM_INFERENCE:
                 path.insert(0, current)
             parent_id = current.get("parent_id")
             current = span_map.get(parent_id) if parent_id else None